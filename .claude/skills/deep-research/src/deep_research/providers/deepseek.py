@@ -3,27 +3,48 @@ DeepSeek Reasoning Provider
 Uses DeepSeek reasoning models with synchronous responses.
 """
 
+import hashlib
 import os
-from typing import Tuple, Optional
-from datetime import datetime
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from typing import List, Tuple, Optional
 
-from ..shared.base import BaseProvider
+from ..shared.base import BaseProviderMixin
 from ..shared.utils import (
     HTTPClient,
+    SingleFlight,
     get_api_key,
-    format_markdown_report,
+    iter_markdown_report,
     ensure_reports_dir,
+    write_parts,
 )
 
 
-class DeepSeekProvider(BaseProvider):
+class DeepSeekProvider(BaseProviderMixin):
     """DeepSeek reasoning provider."""
 
-    def __init__(self):
+    name = "deepseek"
+
+    # Requests currently being sent, keyed by hash of (model, query), so
+    # identical concurrent requests share one upstream call
+    _inflight = SingleFlight()
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
         self.api_key = get_api_key("deepseek")
         self.base_url = os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com")
         self.client = HTTPClient(timeout=300.0)  # Longer timeout for reasoning
-        self._results_cache = {}  # Cache results from create_request
+        self._completions_url = f"{self.base_url}/v1/chat/completions"
+        self._headers_json = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        # Results from create_request awaiting get_results, oldest first;
+        # bounded since each holds a full response with reasoning content
+        self._results_cache = OrderedDict()
+        self._results_cache_size = int(os.getenv("DEEPSEEK_RESULTS_CACHE_SIZE", "64"))
 
     def _get_default_model(self) -> str:
         return "deepseek-reasoner"
@@ -35,13 +56,7 @@ class DeepSeekProvider(BaseProvider):
         verbose: bool = False,
     ) -> Tuple[str, str]:
         """Create a research request (synchronous, returns immediately)."""
-        if not model:
-            model = os.getenv("DEEPSEEK_DEFAULT_MODEL", self._get_default_model())
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        model = self.resolve_model(model)
 
         payload = {
             "model": model,
@@ -55,14 +70,20 @@ class DeepSeekProvider(BaseProvider):
             "stream": False,
         }
 
-        response = self.client.post(
-            f"{self.base_url}/v1/chat/completions",
-            headers=headers,
-            json_data=payload,
+        key = hashlib.sha256(f"{model}\0{query}".encode()).hexdigest()
+        response, shared = self._inflight.do(
+            key,
+            self.client.post,
+            self._completions_url,
+            self._headers_json,
+            payload,
         )
+        if shared and verbose:
+            print("Identical request was already in flight, shared its response", file=sys.stderr)
 
-        # Generate synthetic request ID for consistency
-        request_id = f"deepseek_{id(response)}"
+        # Generate synthetic request ID for consistency; random so that
+        # concurrent and repeated requests never share a cache slot
+        request_id = f"deepseek_{secrets.token_hex(8)}"
 
         # Cache the result since DeepSeek returns immediately
         self._results_cache[request_id] = {
@@ -70,36 +91,45 @@ class DeepSeekProvider(BaseProvider):
             "model": model,
             "query": query,
         }
-
-        # DeepSeek returns immediately
+        while len(self._results_cache) > self._results_cache_size:
+            evicted, _ = self._results_cache.popitem(last=False)
+            self._status_cache.pop(evicted, None)
+
+        # DeepSeek returns immediately. Remember that in memory only, so
+        # get_results caches the report; the status reaches disk together
+        # with the report, never before it exists
+        self._record_status(request_id, "completed", persist=False)
         return request_id, "completed"
 
-    def check_status(self, request_id: str) -> str:
+    def _check_status_impl(self, request_id: str) -> str:
         """Check status (DeepSeek is always completed immediately)."""
         if request_id in self._results_cache:
             return "completed"
         return "in_progress"
 
-    def get_results(self, request_id: str) -> Tuple[str, Optional[str]]:
+    def _get_results_impl(self, request_id: str) -> Tuple[str, Optional[str]]:
         """Retrieve results."""
-        if request_id not in self._results_cache:
-            return "Error: Request not found (already retrieved?)", None
+        try:
+            cached = self._results_cache.pop(request_id)
+        except KeyError:
+            raise LookupError(f"Request not found (expired or unknown): {request_id}") from None
 
-        cached = self._results_cache.pop(request_id)
         response = cached["response"]
 
         # Extract reasoning and response
         content = self._extract_content(response)
 
-        # Format as markdown
-        markdown = format_markdown_report(
-            title="Research Report",
-            content=content,
-            source="DeepSeek Reasoning",
+        # Render once; the file is written from the parts, and only the
+        # returned report joins them
+        parts = list(
+            iter_markdown_report(
+                title="Research Report",
+                content=content,
+                source="DeepSeek Reasoning",
+            )
         )
-
-        # Save to file
-        report_file = self._save_report(request_id, markdown)
+        report_file = self._save_report(request_id, parts)
+        markdown = "".join(parts)
 
         return markdown, report_file
 
@@ -124,16 +154,15 @@ class DeepSeekProvider(BaseProvider):
         except Exception as e:
             return f"Error extracting content: {str(e)}"
 
-    def _save_report(self, request_id: str, markdown: str) -> Optional[str]:
+    def _save_report(self, request_id: str, parts: List[str]) -> Optional[str]:
         """Save report to file."""
         try:
             reports_dir = ensure_reports_dir()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"deepseek_{request_id[:8]}_{timestamp}.md"
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            filename = f"deepseek_{request_id.removeprefix('deepseek_')[:8]}_{timestamp}.md"
             filepath = os.path.join(reports_dir, filename)
 
-            with open(filepath, "w") as f:
-                f.write(markdown)
+            write_parts(filepath, parts)
 
             return filepath
         except Exception as e:
@@ -3,26 +3,61 @@ OpenAI Deep Research Provider
 Uses O1 models with background processing.
 """
 
+import logging
 import os
-from typing import Tuple, Optional
-from datetime import datetime
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Tuple, Optional
 
-from ..shared.base import BaseProvider
+try:
+    import ijson
+except ImportError:  # optional: pip install deep-research-cli[streaming]
+    ijson = None
+
+from ..shared.base import BaseProviderMixin, poll_timeout
 from ..shared.utils import (
     HTTPClient,
+    HTTPError,
     get_api_key,
-    format_markdown_report,
+    json_dumps,
+    iter_markdown_report,
     ensure_reports_dir,
+    write_parts,
 )
 
+logger = logging.getLogger(__name__)
+
 
-class OpenAIProvider(BaseProvider):
+class OpenAIProvider(BaseProviderMixin):
     """OpenAI Deep Research provider."""
 
-    def __init__(self):
+    name = "openai"
+
+    # A long-poll answered in less than this share of the requested wait,
+    # with no status change, means the server ignored ?wait
+    LONG_POLL_HELD_FRACTION = 0.8
+
+    # Upstream status -> normalized status; anything unknown is in progress
+    _STATUS_MAP = {
+        "processing": "in_progress",
+        "pending": "in_progress",
+        "completed": "completed",
+        "failed": "failed",
+    }
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
         self.api_key = get_api_key("openai")
         self.base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
         self.client = HTTPClient(timeout=120.0)
+        self._research_url = f"{self.base_url}/research"
+        self._headers_auth = {"Authorization": f"Bearer {self.api_key}"}
+        self._headers_json = {**self._headers_auth, "Content-Type": "application/json"}
+        # Server-held wait for long-polling status checks (0 disables)
+        self.long_poll_wait = int(os.getenv("OPENAI_LONG_POLL_WAIT", "60"))
 
     def _get_default_model(self) -> str:
         return "o1"
@@ -34,13 +69,7 @@ class OpenAIProvider(BaseProvider):
         verbose: bool = False,
     ) -> Tuple[str, str]:
         """Create a research request with OpenAI Deep Research."""
-        if not model:
-            model = os.getenv("OPENAI_DEFAULT_MODEL", self._get_default_model())
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        model = self.resolve_model(model)
 
         payload = {
             "model": model,
@@ -55,57 +84,184 @@ class OpenAIProvider(BaseProvider):
             ],
             "background": True,  # Enable background processing
         }
+        if self.callback_url:
+            payload["callback_url"] = self.callback_url
 
         response = self.client.post(
-            f"{self.base_url}/research",
-            headers=headers,
+            self._research_url,
+            headers=self._headers_json,
             json_data=payload,
         )
 
         request_id = response.get("id")
         status = response.get("status")
+        self._track_request(request_id, model)
 
         # Normalize status
         if status == "completed":
             status = "completed"
+            self._record_status(request_id, status)
         else:
             status = "in_progress"
 
         return request_id, status
 
-    def check_status(self, request_id: str) -> str:
+    def _check_status_impl(self, request_id: str) -> str:
         """Check the status of a research request."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
-        response = self.client.get(
-            f"{self.base_url}/research/{request_id}",
-            headers=headers,
+        response = self._conditional_get(
+            f"{self._research_url}/{request_id}",
+            request_id,
+            self._headers_auth,
         )
 
-        status = response.get("status", "unknown")
+        status = response.get("status")
+        self._status_detail[request_id] = status
+        return self._STATUS_MAP.get(status, "in_progress")
 
-        # Normalize status
-        if status in ["processing", "pending"]:
-            return "in_progress"
-        elif status == "completed":
-            return "completed"
-        elif status == "failed":
-            return "failed"
-        else:
-            return "in_progress"
+    def check_status_long(self, request_id: str, wait: int = 60) -> Optional[str]:
+        """
+        Long-poll the status of a research request.
 
-    def get_results(self, request_id: str) -> Tuple[str, Optional[str]]:
-        """Retrieve completed research results."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-        }
+        The server holds the request open for up to ``wait`` seconds until
+        the status changes. Returns None if the server does not support
+        long-polling, in which case callers should fall back to check_status.
+        """
+        previous = self._status_detail.get(request_id)
+        started = time.monotonic()
+        try:
+            response = self.client.get(
+                f"{self._research_url}/{request_id}",
+                headers=self._headers_auth,
+                params={"wait": wait},
+                timeout=wait + 10,
+            )
+        except HTTPError as e:
+            if e.status_code in (400, 406):
+                return None
+            raise
 
-        response = self.client.get(
-            f"{self.base_url}/research/{request_id}",
-            headers=headers,
-        )
+        detail = response.get("status")
+        self._status_detail[request_id] = detail
+        status = self._STATUS_MAP.get(detail, "in_progress")
+
+        # A held request returns near ``wait`` or when the status changes;
+        # anything else is a server ignoring ?wait, which must not be
+        # re-requested without a pause
+        held = time.monotonic() - started >= wait * self.LONG_POLL_HELD_FRACTION
+        changed = previous is not None and detail != previous
+        if status == "in_progress" and not (held or changed):
+            return None
+
+        self._record_status(request_id, status)
+        return status
+
+    def poll_until_complete(
+        self,
+        request_id: str,
+        poll_interval: float = 2.0,
+        max_polls: int = 64,
+        verbose: bool = False,
+        max_interval: float = 30.0,
+        timeout_seconds: Optional[float] = None,
+    ) -> str:
+        """Wait for completion via long-polling, falling back to regular polling."""
+        # Callbacks wake the regular poll loop; a held long-poll can't be woken
+        if self.long_poll_wait <= 0 or self.callback_url:
+            return super().poll_until_complete(
+                request_id, poll_interval, max_polls, verbose, max_interval, timeout_seconds
+            )
+
+        # Same overall budget as the backoff schedule
+        started = time.monotonic()
+        deadline = started + poll_timeout(timeout_seconds, max_polls, max_interval)
+        # One worker thread runs this loop's long-polls, so cancel() need not
+        # wait out a held request
+        jobs = queue.SimpleQueue()
+        threading.Thread(target=self._long_poll_worker, args=(jobs,), daemon=True).start()
+        try:
+            while True:
+                if self._cancel.is_set():
+                    return "cancelled"
+                # Never hold a request past the deadline
+                wait = int(min(self.long_poll_wait, deadline - time.monotonic()))
+                if wait < 1:
+                    break
+                status = self._check_status_long_interruptible(jobs, request_id, wait)
+                if status == "cancelled":
+                    return status
+                if status is None:
+                    self.long_poll_wait = 0
+                    logger.debug("  Long-polling unsupported, falling back to polling")
+                    # Only the time left in the budget, not a fresh one
+                    return super().poll_until_complete(
+                        request_id,
+                        poll_interval,
+                        max_polls,
+                        verbose,
+                        max_interval,
+                        timeout_seconds=max(0.0, deadline - time.monotonic()),
+                    )
+                if status in ("completed", "failed"):
+                    return status
+                logger.debug(
+                    "  [Long-poll] Status: %s (elapsed: %.0fs)",
+                    status,
+                    time.monotonic() - started,
+                )
+        finally:
+            jobs.put(None)
+
+        # Under a second left: too short to hold, so check once more
+        status = self.check_status(request_id, max_age=0)
+        if status in ("completed", "failed"):
+            return status
+        print("  ⏱ Timeout while long-polling", file=sys.stderr)
+        return "in_progress"
+
+    def _long_poll_worker(self, jobs: "queue.SimpleQueue") -> None:
+        """Run queued check_status_long calls until a None job arrives."""
+        for result, request_id, wait in iter(jobs.get, None):
+            try:
+                result.set_result(self.check_status_long(request_id, wait))
+            except BaseException as e:
+                result.set_exception(e)
+
+    def _check_status_long_interruptible(
+        self, jobs: "queue.SimpleQueue", request_id: str, wait: int
+    ) -> Optional[str]:
+        """
+        check_status_long on the loop's worker thread, waiting on an event
+        of this call's own that cancel() also sets.
+
+        Returns "cancelled" if cancel() was called meanwhile; the abandoned
+        request then finishes (or times out) in the daemon worker.
+        """
+        result = Future()
+        done = threading.Event()
+        result.add_done_callback(lambda _: done.set())
+        self._interrupts.add(done)
+        try:
+            # cancel() may have run before the event was registered
+            if self._cancel.is_set():
+                return "cancelled"
+            jobs.put((result, request_id, wait))
+            done.wait()
+        finally:
+            self._interrupts.discard(done)
+        if not result.done():
+            return "cancelled"
+        return result.result()
+
+    def _get_results_impl(self, request_id: str) -> Tuple[str, Optional[str]]:
+        """Retrieve completed research results."""
+        response = None
+        if ijson is not None:
+            response = self._stream_first_content(request_id)
+        if response is None:
+            response = self.client.get(
+                f"{self._research_url}/{request_id}",
+                headers=self._headers_auth,
+            )
 
         # Extract report from response
         report_content = self._extract_report(response)
@@ -113,67 +269,89 @@ class OpenAIProvider(BaseProvider):
         # Extract citations if available
         citations = self._extract_citations(response)
 
-        # Format as markdown
-        markdown = format_markdown_report(
-            title="Research Report",
-            content=report_content,
-            citations=citations,
-            source="OpenAI Deep Research",
+        # Render once; the file is written from the parts, and only the
+        # returned report joins them
+        parts = list(
+            iter_markdown_report(
+                title="Research Report",
+                content=report_content,
+                citations=citations,
+                source="OpenAI Deep Research",
+            )
         )
-
-        # Save to file
-        report_file = self._save_report(request_id, markdown)
+        report_file = self._save_report(request_id, parts)
+        markdown = "".join(parts)
 
         return markdown, report_file
 
+    def _stream_first_content(self, request_id: str) -> Optional[dict]:
+        """
+        Stream the results and parse only the first ``content`` item.
+
+        Avoids materialising the whole (possibly multi-MB) response; the
+        download stops as soon as the item is complete. Returns a response
+        dict holding just that item, or None if the item holds no report
+        (the caller then needs the full response for the fallbacks in
+        _extract_report).
+        """
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "content.item", use_float=True)
+        with self.client.stream_get(
+            f"{self._research_url}/{request_id}",
+            headers=self._headers_auth,
+        ) as chunks:
+            for chunk in chunks:
+                parser.send(chunk)
+                if items:
+                    break
+
+        if not items:
+            return None
+        item = items[0]
+        if not isinstance(item, dict) or not ("research" in item or "text" in item):
+            return None
+        return {"content": [item]}
+
     def _extract_report(self, response: dict) -> str:
         """Extract report content from response."""
-        # OpenAI response structure: response.content[0].research
+        # Happy path: response.content[0].research
+        try:
+            return response["content"][0]["research"]
+        except (KeyError, IndexError, TypeError):
+            pass
+
+        # Fallbacks: a plain text item, then a top-level report
         try:
-            # Handle different response structures
-            if "content" in response:
-                content = response.get("content")
-                if isinstance(content, list) and len(content) > 0:
-                    item = content[0]
-                    if "research" in item:
-                        return item["research"]
-                    elif "text" in item:
-                        return item["text"]
-
-            # Fallback: try getting report directly
-            if "report" in response:
-                return response["report"]
-
-            # Last resort: return full response as JSON for debugging
-            import json
-            return f"```json\n{json.dumps(response, indent=2)}\n```"
+            return response["content"][0]["text"]
+        except (KeyError, IndexError, TypeError):
+            pass
+        try:
+            return response["report"]
+        except (KeyError, TypeError):
+            pass
+
+        # Last resort: return full response as JSON for debugging
+        try:
+            return f"```json\n{json_dumps(response, indent=True)}\n```"
         except Exception as e:
             return f"Error extracting report: {str(e)}"
 
     def _extract_citations(self, response: dict) -> list:
         """Extract citations from response."""
-        citations = []
         try:
-            if "content" in response:
-                content = response.get("content")
-                if isinstance(content, list) and len(content) > 0:
-                    item = content[0]
-                    if "citations" in item:
-                        citations = item["citations"]
-        except Exception:
-            pass
-        return citations
+            return response["content"][0]["citations"]
+        except (KeyError, IndexError, TypeError):
+            return []
 
-    def _save_report(self, request_id: str, markdown: str) -> Optional[str]:
+    def _save_report(self, request_id: str, parts: List[str]) -> Optional[str]:
         """Save report to file."""
         try:
             reports_dir = ensure_reports_dir()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"openai_{request_id[:8]}_{timestamp}.md"
             filepath = os.path.join(reports_dir, filename)
 
-            with open(filepath, "w") as f:
-                f.write(markdown)
+            write_parts(filepath, parts)
 
             return filepath
         except Exception as e:
@@ -15,21 +15,32 @@ Providers:
 
 import sys
 import argparse
+import importlib
+import logging
 import os
+import subprocess
+from typing import TYPE_CHECKING, Optional
 
-from .providers.openai import OpenAIProvider
-from .providers.deepseek import DeepSeekProvider
-from .shared.utils import print_error, print_success
+from .shared import cache
+from .shared.utils import (
+    close_shared_client,
+    print_error,
+    print_success,
+    write_file,
+)
 
+if TYPE_CHECKING:
+    from .shared.base import BaseProvider
 
-def get_provider(provider_name: str):
-    """Get provider instance by name."""
+
+def get_provider(provider_name: str) -> "BaseProvider":
+    """Get provider instance by name, importing only that provider's module."""
     providers = {
-        "openai": OpenAIProvider,
-        "deepseek": DeepSeekProvider,
+        "openai": ("openai", "OpenAIProvider"),
+        "deepseek": ("deepseek", "DeepSeekProvider"),
         # Future providers
-        # "anthropic": AnthropicProvider,
-        # "google": GoogleProvider,
+        # "anthropic": ("anthropic", "AnthropicProvider"),
+        # "google": ("google", "GoogleProvider"),
     }
 
     if provider_name not in providers:
@@ -38,7 +49,215 @@ def get_provider(provider_name: str):
         print_error(f"Available: {available}")
         sys.exit(1)
 
-    return providers[provider_name]()
+    module_name, class_name = providers[provider_name]
+    module = importlib.import_module(f".providers.{module_name}", __package__)
+    return getattr(module, class_name)()
+
+
+def lookup_cached_report(provider, query: str, args) -> Optional[str]:
+    """
+    Return a cached report for the query, or None on a miss.
+
+    Fresh entries are returned as is; stale entries are returned while a
+    background process refreshes them.
+    """
+    if args.no_cache:
+        return None
+
+    key = cache.make_key(provider.name, provider.resolve_model(args.model), query)
+    report_md, age = cache.get(key)
+    if report_md is None or age >= cache.stale_ttl():
+        return None
+
+    if age < cache.fresh_ttl():
+        print(f"⚡ Using cached {provider.name} report ({age:.0f}s old)", file=sys.stderr)
+    else:
+        # A refresh runs for at most the polling budget, plus some slack
+        budget = args.timeout if args.timeout is not None else args.max_polls * args.max_interval
+        if cache.acquire_refresh(key, budget + 60):
+            print(
+                f"⚡ Using cached {provider.name} report ({age:.0f}s old, refreshing in background)",
+                file=sys.stderr,
+            )
+            _refresh_in_background(provider.name, query, args, key)
+        else:
+            print(
+                f"⚡ Using cached {provider.name} report ({age:.0f}s old, refresh already running)",
+                file=sys.stderr,
+            )
+    return report_md
+
+
+def store_cached_report(
+    provider, query: str, args, report_md: str, report_file: Optional[str]
+) -> None:
+    """Write a completed report back to the cache."""
+    model = provider.resolve_model(args.model)
+    key = cache.make_key(provider.name, model, query)
+    try:
+        cache.put(
+            key,
+            report_md,
+            provider=provider.name,
+            model=model,
+            report_file=report_file,
+        )
+    except OSError as e:
+        print(f"Warning: Could not cache report: {e}", file=sys.stderr)
+    # Ends a background refresh of this entry, if this run is one
+    cache.release_refresh(key)
+
+
+def _refresh_in_background(provider_name: str, query: str, args, key: str) -> None:
+    """
+    Re-run the research in a detached process that updates the cache.
+
+    The caller holds the entry's refresh marker; the child releases it
+    when it stores the new report, or it expires if the child fails.
+    """
+    cmd = [
+        sys.executable, "-m", "deep_research.research",
+        "--provider", provider_name,
+        "--poll",
+        "--poll-interval", str(args.poll_interval),
+        "--max-interval", str(args.max_interval),
+        "--max-polls", str(args.max_polls),
+        "--no-cache",
+    ]
+    if args.timeout is not None:
+        cmd += ["--timeout", str(args.timeout)]
+    if args.model:
+        cmd += ["--model", args.model]
+    cmd += ["--", query]
+
+    try:
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        cache.release_refresh(key)
+        raise
+
+
+def start_callback_server(providers: list, args):
+    """Start the --callback-url listener and point the providers at it."""
+    if not args.callback_url:
+        return None
+
+    from urllib.parse import urlparse
+    from .shared.callback import CallbackServer
+
+    port = args.callback_port or urlparse(args.callback_url).port or 8080
+
+    def on_status(request_id: str, status: str) -> None:
+        for provider in providers:
+            provider.notify_complete(request_id, status)
+
+    server = CallbackServer(port, on_status).start()
+    for provider in providers:
+        provider.callback_url = args.callback_url
+    if args.verbose:
+        print(f"📡 Listening for status callbacks on port {port}", file=sys.stderr)
+    return server
+
+
+def write_output(path: str, report_md: str) -> None:
+    """Save the report to the --output file."""
+    try:
+        write_file(path, report_md)
+        print(f"💾 Report saved to: {path}", file=sys.stderr)
+    except IOError as e:
+        print_error(f"Error saving to output file: {e}")
+        sys.exit(1)
+
+
+async def _research_all(providers: list, query: str, args) -> list:
+    """Run the full research flow on several providers concurrently."""
+    import asyncio
+
+    try:
+        return await asyncio.gather(
+            *(
+                provider.arun(
+                    query,
+                    poll=args.poll,
+                    poll_interval=args.poll_interval,
+                    max_polls=args.max_polls,
+                    verbose=args.verbose,
+                    max_interval=args.max_interval,
+                    timeout_seconds=args.timeout,
+                )
+                for provider in providers
+            ),
+            return_exceptions=True,
+        )
+    except asyncio.CancelledError:
+        # Ctrl-C: stop the worker threads' poll loops so shutdown doesn't
+        # wait for them to finish sleeping
+        for provider in providers:
+            provider.cancel()
+        raise
+
+
+def run_multi_provider(provider_names: list, query: str, args) -> None:
+    """Research a query with several providers at once and print all reports."""
+    import asyncio
+
+    print(f"📋 Researching with {', '.join(provider_names)}...", file=sys.stderr)
+    providers = [get_provider(name) for name in provider_names]
+    reports = {}
+    callback_server = None
+    try:
+        for provider in providers:
+            cached = lookup_cached_report(provider, query, args)
+            if cached is not None:
+                reports[provider.name] = cached
+
+        pending = [provider for provider in providers if provider.name not in reports]
+        callback_server = start_callback_server(pending, args)
+        results = asyncio.run(_research_all(pending, query, args))
+    finally:
+        if callback_server is not None:
+            callback_server.close()
+        for provider in providers:
+            provider.close()
+        close_shared_client()
+
+    failed = False
+    for provider, result in zip(pending, results):
+        name = provider.name
+        if isinstance(result, Exception):
+            print_error(f"{name}: {result}")
+            failed = True
+            continue
+
+        request_id, status, report_md, report_file = result
+        if status != "completed":
+            print_error(f"{name}: research {status.replace('_', ' ')} (request ID: {request_id})")
+            failed = True
+            continue
+
+        reports[name] = report_md
+        store_cached_report(provider, query, args, report_md, report_file)
+        if report_file:
+            print(f"💾 {name} report saved to: {report_file}", file=sys.stderr)
+
+    if not reports:
+        sys.exit(1)
+
+    combined = "\n\n---\n\n".join(reports[name] for name in provider_names if name in reports)
+    print(combined)
+
+    if args.output:
+        write_output(args.output, combined)
+
+    if failed:
+        sys.exit(1)
+    print_success("Research complete", file=sys.stderr)
 
 
 def main():
@@ -50,6 +269,7 @@ Examples:
   research "What is quantum computing?" --provider openai --poll
   research "Latest AI breakthroughs" --provider deepseek
   research "Explain transformers" --provider openai --model o1-mini
+  research "Compare LLM architectures" --provider openai,deepseek --poll
   research --check-status <id> --provider openai
   research --get-results <id> --provider openai
         """,
@@ -66,7 +286,8 @@ Examples:
     parser.add_argument(
         "--provider",
         default=os.getenv("REASONING_DEFAULT_PROVIDER", "deepseek"),
-        help="AI provider: openai, deepseek (default: $REASONING_DEFAULT_PROVIDER or deepseek)",
+        help="AI provider: openai, deepseek, or a comma-separated list to query "
+        "several concurrently (default: $REASONING_DEFAULT_PROVIDER or deepseek)",
     )
     parser.add_argument(
         "--model",
@@ -79,15 +300,39 @@ Examples:
     )
     parser.add_argument(
         "--poll-interval",
-        type=int,
-        default=10,
-        help="Polling interval in seconds (default: 10)",
+        type=float,
+        default=2.0,
+        help="Base polling interval in seconds, doubled after each poll (default: 2)",
+    )
+    parser.add_argument(
+        "--max-interval",
+        type=float,
+        default=30.0,
+        help="Maximum polling interval in seconds (default: 30)",
     )
     parser.add_argument(
         "--max-polls",
         type=int,
-        default=180,
-        help="Maximum polling attempts (default: 180, ~30 minutes)",
+        default=64,
+        help="Polling budget: give up after max-polls x max-interval seconds "
+        "(default: 64, ~30 minutes; ignored with --timeout)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Give up polling after this many seconds (overrides --max-polls)",
+    )
+    parser.add_argument(
+        "--callback-url",
+        metavar="URL",
+        help="Public URL the provider should call with status updates instead of "
+        "being polled (OpenAI only; e.g. an ngrok tunnel to --callback-port)",
+    )
+    parser.add_argument(
+        "--callback-port",
+        type=int,
+        help="Local port for the callback listener (default: port of --callback-url, or 8080)",
     )
     parser.add_argument(
         "--output",
@@ -104,6 +349,11 @@ Examples:
         metavar="REQUEST_ID",
         help="Get results of completed request (requires --provider)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached reports for this query (the new report is still cached)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -112,9 +362,26 @@ Examples:
 
     args = parser.parse_args()
 
+    # Poll progress is logged at DEBUG level; --verbose shows it
+    logging.basicConfig(format="%(message)s", stream=sys.stderr)
+    if args.verbose:
+        logging.getLogger("deep_research").setLevel(logging.DEBUG)
+
+    provider_names = [name.strip() for name in args.provider.split(",") if name.strip()]
+    if not provider_names:
+        parser.error("--provider must name at least one provider")
+    if len(provider_names) > 1:
+        if args.check_status or args.get_results:
+            parser.error("--check-status and --get-results take a single --provider")
+        if args.model:
+            parser.error("--model cannot be combined with multiple providers")
+
+    provider = None
+    callback_server = None
     try:
-        # Get provider
-        provider = get_provider(args.provider)
+        # Get provider (multi-provider runs create their own below)
+        if len(provider_names) == 1:
+            provider = get_provider(provider_names[0])
 
         # Handle --check-status
         if args.check_status:
@@ -159,6 +426,10 @@ Examples:
         if not query:
             parser.error("query is required (provide as argument or use --query-file)")
 
+        if len(provider_names) > 1:
+            run_multi_provider(provider_names, query, args)
+            return
+
         if args.verbose:
             print(f"Provider: {args.provider}")
             print(f"Query: {query[:100]}..." if len(query) > 100 else f"Query: {query}")
@@ -166,10 +437,20 @@ Examples:
                 print(f"Output file: {args.output}")
             print()
 
+        cached = lookup_cached_report(provider, query, args)
+        if cached is not None:
+            print(cached)
+            if args.output:
+                write_output(args.output, cached)
+            print_success("Research complete", file=sys.stderr)
+            return
+
+        callback_server = start_callback_server([provider], args)
+
         # Step 1: Create research request
         print("📋 Creating research request...", file=sys.stderr)
         request_id, status = provider.create_request(
-            query=args.query,
+            query=query,
             model=args.model,
             verbose=args.verbose,
         )
@@ -177,12 +458,18 @@ Examples:
 
         # Step 2: Check status and poll if needed
         if status == "in_progress" and args.poll:
-            print(f"⏳ Polling for results (interval: {args.poll_interval}s)...", file=sys.stderr)
+            print(
+                f"⏳ Polling for results (interval: {args.poll_interval:g}s"
+                f" up to {args.max_interval:g}s)...",
+                file=sys.stderr,
+            )
             status = provider.poll_until_complete(
                 request_id=request_id,
                 poll_interval=args.poll_interval,
                 max_polls=args.max_polls,
                 verbose=args.verbose,
+                max_interval=args.max_interval,
+                timeout_seconds=args.timeout,
             )
 
         if status == "completed":
@@ -194,29 +481,30 @@ Examples:
         elif status == "failed":
             print_error("Research failed")
             sys.exit(1)
+        elif status == "cancelled":
+            print_error("Research cancelled")
+            print_error(f"Request ID: {request_id}")
+            sys.exit(130)
 
         # Step 3: Get results
         print("📥 Retrieving results...", file=sys.stderr)
         report_md, report_file = provider.get_results(request_id=request_id)
+        store_cached_report(provider, query, args, report_md, report_file)
 
         # Output the report
         print(report_md)
 
         # Save to file if requested
         if args.output:
-            try:
-                with open(args.output, 'w') as f:
-                    f.write(report_md)
-                print(f"💾 Report saved to: {args.output}", file=sys.stderr)
-            except IOError as e:
-                print_error(f"Error saving to output file: {e}")
-                sys.exit(1)
+            write_output(args.output, report_md)
         elif report_file:
             print(f"💾 Report also saved to: {report_file}", file=sys.stderr)
 
         print_success("Research complete", file=sys.stderr)
 
     except KeyboardInterrupt:
+        if provider is not None:
+            provider.cancel()
         print_error("\nInterrupted by user")
         sys.exit(130)
     except Exception as e:
@@ -225,6 +513,12 @@ Examples:
             import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        if callback_server is not None:
+            callback_server.close()
+        if provider is not None:
+            provider.close()
+        close_shared_client()
 
 
 if __name__ == "__main__":
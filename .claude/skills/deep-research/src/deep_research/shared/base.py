@@ -1,17 +1,46 @@
 """
-Base provider class for research services.
+Base provider interface and shared implementation for research services.
 """
 
-from abc import ABC, abstractmethod
-from typing import Tuple, Optional, List
+from typing import TYPE_CHECKING, Dict, Tuple, Optional, List, Protocol, Set, Union
+import logging
+import os
+import random
+import threading
 import time
 import sys
 
+from . import cache
+from .utils import SingleFlight
 
-class BaseProvider(ABC):
-    """Abstract base class for research providers."""
+if TYPE_CHECKING:
+    import asyncio
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+logger = logging.getLogger(__name__)
+
+
+def _no_log(*args) -> None:
+    """Stand-in for logger.debug when debug logging is off."""
+
+
+def poll_timeout(
+    timeout_seconds: Optional[float],
+    max_polls: int,
+    max_interval: float,
+) -> float:
+    """Seconds to poll for: ``timeout_seconds``, else ``max_polls * max_interval``."""
+    if timeout_seconds is not None:
+        return timeout_seconds
+    return max_polls * max_interval
+
+
+class BaseProvider(Protocol):
+    """Interface of a research provider, as used by the CLI."""
+
+    name: str
 
-    @abstractmethod
     def create_request(
         self,
         query: str,
@@ -30,78 +59,625 @@ class BaseProvider(ABC):
             Tuple of (request_id, status)
             where status is "completed" or "in_progress"
         """
-        pass
+        ...
+
+    def check_status(self, request_id: str, max_age: Optional[float] = None) -> str:
+        """Check request status: "completed", "in_progress", or "failed"."""
+        ...
+
+    def get_results(self, request_id: str) -> Tuple[str, Optional[str]]:
+        """Get research results as (markdown_report, report_file_path)."""
+        ...
+
+    def poll_until_complete(
+        self,
+        request_id: str,
+        poll_interval: float = 2.0,
+        max_polls: int = 64,
+        verbose: bool = False,
+        max_interval: float = 30.0,
+        timeout_seconds: Optional[float] = None,
+    ) -> str:
+        """Poll request until completion; returns the final status."""
+        ...
+
+    def cancel(self) -> None:
+        """Stop any poll loop on this provider as soon as possible."""
+        ...
+
+    def close(self) -> None:
+        """Release network resources held by the provider."""
+        ...
+
+
+class BaseProviderMixin:
+    """
+    Shared implementation of BaseProvider.
+
+    Providers inherit from this and implement create_request,
+    _check_status_impl and _get_results_impl.
+    """
+
+    name = "base"
+
+    # URL the upstream should call back with status changes; only used by
+    # providers whose API supports push notifications
+    callback_url: Optional[str] = None
+
+    # Exponent cap for the backoff schedule (2**6 times the base interval)
+    MAX_BACKOFF_EXPONENT = 6
+
+    # Seconds a non-terminal status is reused, so bursty callers share one
+    # status request; terminal statuses are kept for the provider's lifetime
+    STATUS_CACHE_TTL = 2.0
+
+    # Completion times kept per (provider, model) to seed the first poll,
+    # and how many are needed before they are trusted
+    RUNTIME_HISTORY_SIZE = 50
+    MIN_RUNTIME_SAMPLES = 5
+
+    # Serialises updates of the runtime history, which concurrent pollers
+    # of one model all read, extend and write back
+    _runtimes_lock = threading.Lock()
+
+    def __init__(self, seed: Optional[int] = None):
+        # Per-provider RNG for poll jitter; seed it for reproducible schedules
+        self._rng = random.Random(seed)
+        self._wake = threading.Event()
+        self._cancel = threading.Event()
+        # Async pollers waiting on a request: request_id -> (loop, event)
+        self._pending: Dict[str, Tuple["asyncio.AbstractEventLoop", "asyncio.Event"]] = {}
+        # Sync waits blocked on something other than _wake (e.g. a held
+        # long-poll), each on its own event
+        self._interrupts: Set[threading.Event] = set()
+        # request_id -> (monotonic time fetched, status)
+        self._status_cache: Dict[str, Tuple[float, str]] = {}
+        # Concurrent status/results fetches for one request share a call
+        self._flights = SingleFlight()
+        # request_id -> (validators, parsed body) of the last conditional GET
+        self._etags: Dict[str, Tuple[dict, dict]] = {}
+        # Raw upstream status (e.g. "queued", "searching") when the provider
+        # reports more detail than in_progress; a change counts as progress
+        self._status_detail: Dict[str, str] = {}
+        # request_id -> (monotonic time created, model, p10 of the model's
+        # past runtimes or None), for runtime history
+        self._created: Dict[str, Tuple[float, str, Optional[float]]] = {}
+
+    def cancel(self) -> None:
+        """
+        Stop any poll loop on this provider as soon as possible.
+
+        Safe to call from any thread; waiting polls, sync or async, return
+        "cancelled" immediately instead of finishing their sleep.
+        """
+        self._cancel.set()
+        self._wake.set()
+        for event in list(self._interrupts):
+            event.set()
+        for loop, event in list(self._pending.values()):
+            loop.call_soon_threadsafe(event.set)
+
+    def notify_complete(self, request_id: str, status: str) -> None:
+        """
+        Handle a status pushed by the upstream (e.g. via webhook).
+
+        Wakes any sync or async poll loop waiting on this provider so it
+        checks the status at once. The pushed status itself is not trusted:
+        callbacks are unauthenticated, so the poll loop confirms it with
+        the upstream before returning or caching anything.
+        Safe to call from any thread.
+        """
+        self._wake.set()
+        pending = self._pending.get(request_id)
+        if pending is not None:
+            loop, event = pending
+            loop.call_soon_threadsafe(event.set)
+
+    def create_request(
+        self,
+        query: str,
+        model: Optional[str] = None,
+        verbose: bool = False,
+    ) -> Tuple[str, str]:
+        """Create a research request; see BaseProvider.create_request."""
+        raise NotImplementedError
+
+    def _get_results_impl(self, request_id: str) -> Tuple[str, Optional[str]]:
+        """
+        Fetch research results from the upstream; see get_results.
+
+        Raises LookupError if there are no results for the request, so
+        that nothing is cached in place of a report.
+        """
+        raise NotImplementedError
+
+    def _check_status_impl(self, request_id: str) -> str:
+        """Fetch request status from the upstream; see check_status."""
+        raise NotImplementedError
 
-    @abstractmethod
     def get_results(self, request_id: str) -> Tuple[str, Optional[str]]:
         """
         Get research results.
 
+        Results of completed requests are cached on disk, so repeated calls
+        (and later CLI runs) don't download the report again.
+
         Args:
             request_id: Request ID from create_request
 
         Returns:
             Tuple of (markdown_report, report_file_path)
+
+        Raises:
+            LookupError: The upstream has no results for this request
         """
-        pass
+        markdown, meta = cache.get_entry(self._request_cache_key(request_id))
+        if markdown is not None:
+            return markdown, meta.get("report_file")
 
-    @abstractmethod
-    def check_status(self, request_id: str) -> str:
+        result, _ = self._flights.do(("results", request_id), self._fetch_results, request_id)
+        return result
+
+    def check_status(self, request_id: str, max_age: Optional[float] = None) -> str:
         """
         Check request status.
 
+        Terminal statuses are cached on disk; other statuses are reused
+        for up to ``max_age`` seconds.
+
         Args:
             request_id: Request ID from create_request
+            max_age: Seconds a cached in-progress status may be reused;
+                defaults to STATUS_CACHE_TTL, poll loops pass 0
 
         Returns:
             Status string: "completed", "in_progress", or "failed"
         """
-        pass
+        if max_age is None:
+            max_age = self.STATUS_CACHE_TTL
+        cached = self._status_cache.get(request_id)
+        if cached is not None:
+            fetched, status = cached
+            if status in TERMINAL_STATUSES or time.monotonic() - fetched < max_age:
+                return status
+        else:
+            # Disk only matters on the first lookup; afterwards the status
+            # cache knows the request is still running
+            _, meta = cache.get_entry(self._request_cache_key(request_id))
+            if meta is not None and meta.get("status") in TERMINAL_STATUSES:
+                status = meta["status"]
+                self._status_cache[request_id] = (time.monotonic(), status)
+                return status
+
+        status, _ = self._flights.do(("status", request_id), self._fetch_status, request_id)
+        return status
+
+    def _fetch_status(self, request_id: str) -> str:
+        """Fetch a status from the upstream and record it."""
+        status = self._check_status_impl(request_id)
+        self._record_status(request_id, status)
+        return status
+
+    def _fetch_results(self, request_id: str) -> Tuple[str, Optional[str]]:
+        """Fetch results from the upstream, caching those of completed requests."""
+        markdown, report_file = self._get_results_impl(request_id)
+        # Only keep reports of requests already seen to complete; anything
+        # else may be a partial response
+        cached = self._status_cache.get(request_id)
+        if cached is not None and cached[1] == "completed":
+            self._cache_put(
+                self._request_cache_key(request_id),
+                markdown,
+                status="completed",
+                report_file=report_file,
+            )
+        return markdown, report_file
+
+    def _conditional_get(self, url: str, request_id: str, headers: dict) -> dict:
+        """
+        GET a request's status resource, skipping unchanged bodies.
+
+        Sends the ETag (or Last-Modified) from the previous response so the
+        upstream can answer 304 Not Modified; the previously parsed body is
+        then returned without downloading or parsing it again. Providers
+        call this from _check_status_impl.
+
+        Returns:
+            Parsed response body
+        """
+        validators, body = self._etags.get(request_id, (None, None))
+        fresh, validators = self.client.get_conditional(url, headers, validators)
+        if fresh is None:
+            return body
+        if validators:
+            self._etags[request_id] = (validators, fresh)
+        return fresh
+
+    def _record_status(self, request_id: str, status: str, persist: bool = True) -> None:
+        """
+        Remember a status; terminal ones are written through to disk
+        unless ``persist`` is False.
+        """
+        previous = self._status_cache.get(request_id)
+        self._status_cache[request_id] = (time.monotonic(), status)
+        if not persist:
+            return
+        if status in TERMINAL_STATUSES and (previous is None or previous[1] != status):
+            self._cache_put(self._request_cache_key(request_id), None, status=status)
+            if status == "completed":
+                self._record_runtime(request_id)
+
+    def _cache_put(self, key: str, markdown: Optional[str], **metadata) -> None:
+        """
+        Write a cache entry, best effort.
+
+        The cache only saves requests; an unwritable reports directory must
+        not fail a status check or a request that has already been paid for.
+        """
+        try:
+            cache.put(key, markdown, **metadata)
+        except OSError as e:
+            logger.debug("  Could not write cache entry: %s", e)
+
+    def _request_cache_key(self, request_id: str) -> str:
+        """Cache key for per-request status and results."""
+        return cache.make_key("request", self.name, request_id)
 
     def poll_until_complete(
         self,
         request_id: str,
-        poll_interval: int = 10,
-        max_polls: int = 180,
+        poll_interval: float = 2.0,
+        max_polls: int = 64,
         verbose: bool = False,
+        max_interval: float = 30.0,
+        timeout_seconds: Optional[float] = None,
     ) -> str:
         """
         Poll request until completion.
 
+        Uses exponential backoff with full jitter: each delay is drawn
+        uniformly from zero up to ``poll_interval`` doubled once per poll
+        (capped at ``max_interval``). Fast jobs are picked up quickly, long
+        jobs make few requests, and concurrent pollers don't synchronise.
+        The schedule restarts when the upstream reports progress, and the
+        first wait is stretched when past runs show the job can't be done
+        yet (see _next_interval).
+
         Args:
             request_id: Request ID from create_request
-            poll_interval: Seconds between polls
-            max_polls: Maximum number of poll attempts
-            verbose: Enable verbose output
+            poll_interval: Base seconds between polls
+            max_polls: Kept for compatibility; without ``timeout_seconds``
+                the budget is ``max_polls * max_interval`` seconds
+            verbose: Unused, kept for compatibility; poll progress is
+                logged at DEBUG level on this module's logger
+            max_interval: Upper bound on seconds between polls
+            timeout_seconds: Seconds of wall-clock time to wait before
+                giving up
 
         Returns:
-            Final status: "completed" or "failed"
+            Final status: "completed", "failed", "in_progress" on timeout,
+            or "cancelled" if cancel() was called
         """
-        for poll_num in range(1, max_polls + 1):
-            status = self.check_status(request_id)
+        # Bind everything the loop touches once, rather than looking it up
+        # on every poll; the debug hook is a no-op unless DEBUG is enabled
+        monotonic = time.monotonic
+        check = self.check_status
+        next_interval = self._next_interval
+        progress_of = self._status_detail.get
+        wait = self._wake.wait
+        clear = self._wake.clear
+        cancelled = self._cancel.is_set
+        log = logger.debug if logger.isEnabledFor(logging.DEBUG) else _no_log
+
+        started = monotonic()
+        deadline = started + poll_timeout(timeout_seconds, max_polls, max_interval)
+        poll_num = 0
+        attempt = 0
+        last_progress = None
+        while True:
+            poll_num += 1
+            status = check(request_id, 0)
 
             if status == "completed":
                 return "completed"
             elif status == "failed":
                 return "failed"
 
-            # Still in progress, wait and retry
-            if poll_num < max_polls:
-                elapsed = poll_num * poll_interval
-                remaining = (max_polls - poll_num) * poll_interval
-                if verbose:
-                    print(
-                        f"  [Poll {poll_num}/{max_polls}] "
-                        f"Status: {status} "
-                        f"(elapsed: {elapsed}s, timeout: {remaining}s)",
-                        file=sys.stderr,
-                    )
-                time.sleep(poll_interval)
-            else:
-                print(f"  ⏱ Timeout after {poll_num} polls", file=sys.stderr)
+            # Still in progress, back off and retry
+            now = monotonic()
+            remaining = deadline - now
+            if remaining <= 0:
+                print(
+                    f"  ⏱ Timeout after {poll_num} polls ({now - started:.0f}s)",
+                    file=sys.stderr,
+                )
                 return "in_progress"
 
-        return "in_progress"
+            # A new upstream stage suggests more change soon; poll quickly again
+            progress = progress_of(request_id)
+            if progress != last_progress:
+                attempt = 0
+                last_progress = progress
+            delay = min(next_interval(request_id, attempt, poll_interval, max_interval), remaining)
+            attempt += 1
+            log(
+                "  [Poll %d] Status: %s (elapsed: %.0fs, next poll in %.1fs)",
+                poll_num,
+                status,
+                now - started,
+                delay,
+            )
+            # Sleep until the next poll, or until a callback arrives
+            wait(delay)
+            clear()
+            if cancelled():
+                return "cancelled"
+
+    async def poll_until_complete_async(
+        self,
+        request_id: str,
+        timeout: float = 1800.0,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        verbose: bool = False,
+    ) -> str:
+        """
+        Wait for a request to finish without blocking the event loop.
+
+        Waits on an asyncio.Event set by notify_complete() when the
+        upstream pushes status changes, then confirms the status with
+        check_status; between pushes it polls
+        check_status with the same backoff as poll_until_complete, so
+        providers without a push channel still complete.
+
+        Args:
+            request_id: Request ID from create_request
+            timeout: Seconds to wait before giving up
+            poll_interval: Initial seconds between polls
+            max_interval: Upper bound on seconds between polls
+            verbose: Unused, kept for compatibility; see poll_until_complete
+
+        Returns:
+            Final status: "completed", "failed", "in_progress" on timeout,
+            or "cancelled" if cancel() was called
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        self._pending[request_id] = (loop, event)
+        started = loop.time()
+        deadline = started + timeout
+        try:
+            attempt = 0
+            poll_num = 0
+            last_progress = None
+            while True:
+                # cancel() may have run before this request was registered
+                if self._cancel.is_set():
+                    return "cancelled"
+                status = await self.acheck_status(request_id, max_age=0)
+                if status in TERMINAL_STATUSES:
+                    return status
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    print(f"  ⏱ Timeout after {timeout:.0f}s", file=sys.stderr)
+                    return "in_progress"
+
+                progress = self._status_detail.get(request_id)
+                if progress != last_progress:
+                    attempt = 0
+                    last_progress = progress
+                delay = min(
+                    self._next_interval(request_id, attempt, poll_interval, max_interval),
+                    remaining,
+                )
+                attempt += 1
+                poll_num += 1
+                logger.debug(
+                    "  [Poll %d] Status: %s (elapsed: %.0fs, next poll in %.1fs)",
+                    poll_num,
+                    status,
+                    loop.time() - started,
+                    delay,
+                )
+                try:
+                    await asyncio.wait_for(event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+                if self._cancel.is_set():
+                    return "cancelled"
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def poll_many(
+        self,
+        request_ids: List[str],
+        timeout: float = 1800.0,
+        poll_interval: float = 2.0,
+        max_interval: float = 30.0,
+        verbose: bool = False,
+    ) -> Dict[str, Union[str, BaseException]]:
+        """
+        Wait for several requests at once on the running event loop.
+
+        Each request is polled by its own poll_until_complete_async task;
+        all of them share the process-wide HTTP connection pool.
+
+        Args:
+            request_ids: Request IDs from create_request
+            timeout: Seconds to wait for each request before giving up
+            poll_interval: Initial seconds between polls
+            max_interval: Upper bound on seconds between polls
+            verbose: Enable verbose output
+
+        Returns:
+            Dict mapping each request ID to its final status, or to the
+            exception raised while polling it
+        """
+        import asyncio
+
+        tasks = [
+            asyncio.create_task(
+                self.poll_until_complete_async(
+                    request_id,
+                    timeout=timeout,
+                    poll_interval=poll_interval,
+                    max_interval=max_interval,
+                    verbose=verbose,
+                )
+            )
+            for request_id in request_ids
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return dict(zip(request_ids, results))
+
+    def _backoff_delay(self, attempt: int, base: float, max_delay: float) -> float:
+        """Exponential backoff delay with full jitter."""
+        cap = min(max_delay, base * 2 ** min(attempt, self.MAX_BACKOFF_EXPONENT))
+        return self._rng.uniform(0, cap)
+
+    def _next_interval(self, request_id: str, attempt: int, base: float, max_delay: float) -> float:
+        """
+        Seconds to wait before the next poll.
+
+        Backoff as in _backoff_delay, where ``attempt`` counts polls since
+        the upstream last reported progress. The first wait also lasts at
+        least until the fastest 10% of past runs for this provider and
+        model would have finished, since earlier polls are almost
+        certainly wasted.
+        """
+        delay = self._backoff_delay(attempt, base, max_delay)
+        if attempt == 0:
+            delay = max(delay, self._runtime_floor(request_id))
+        return delay
+
+    def _track_request(self, request_id: str, model: str) -> None:
+        """
+        Note when a request was created; providers call this from
+        create_request.
+
+        The runtime history is read here, once per request, so poll loops
+        (including async ones on the event loop) never wait on the disk.
+        """
+        runtimes = self._load_runtimes(model)
+        p10 = None
+        if len(runtimes) >= self.MIN_RUNTIME_SAMPLES:
+            p10 = sorted(runtimes)[len(runtimes) // 10]
+        self._created[request_id] = (time.monotonic(), model, p10)
+
+    def _runtime_floor(self, request_id: str) -> float:
+        """Seconds until the request reaches the p10 of past completion times."""
+        started, _, p10 = self._created.get(request_id, (0.0, None, None))
+        if p10 is None:
+            return 0.0
+        return max(0.0, p10 - (time.monotonic() - started))
+
+    def _load_runtimes(self, model: str) -> List[float]:
+        """Past completion times in seconds for this provider and model."""
+        _, meta = cache.get_entry(self._runtimes_cache_key(model))
+        if meta is None:
+            return []
+        return meta.get("runtimes", [])
+
+    def _record_runtime(self, request_id: str) -> None:
+        """Add a completed request's runtime to the history."""
+        created = self._created.pop(request_id, None)
+        if created is None:
+            return
+        started, model, _ = created
+        runtime = time.monotonic() - started
+        with self._runtimes_lock:
+            runtimes = self._load_runtimes(model)
+            runtimes.append(runtime)
+            self._cache_put(
+                self._runtimes_cache_key(model),
+                None,
+                runtimes=runtimes[-self.RUNTIME_HISTORY_SIZE:],
+            )
+
+    def _runtimes_cache_key(self, model: str) -> str:
+        """Cache key for the completion-time history."""
+        return cache.make_key("runtimes", self.name, model)
+
+    # Async variants run the blocking calls in a worker thread so several
+    # providers (or requests) can wait on the network concurrently. They
+    # import asyncio themselves, keeping it off the single-provider path.
+
+    async def acreate_request(
+        self,
+        query: str,
+        model: Optional[str] = None,
+        verbose: bool = False,
+    ) -> Tuple[str, str]:
+        """Async variant of create_request."""
+        import asyncio
+
+        return await asyncio.to_thread(self.create_request, query, model, verbose)
+
+    async def aget_results(self, request_id: str) -> Tuple[str, Optional[str]]:
+        """Async variant of get_results."""
+        import asyncio
+
+        return await asyncio.to_thread(self.get_results, request_id)
+
+    async def acheck_status(self, request_id: str, max_age: Optional[float] = None) -> str:
+        """Async variant of check_status."""
+        import asyncio
+
+        return await asyncio.to_thread(self.check_status, request_id, max_age)
+
+    async def arun(
+        self,
+        query: str,
+        model: Optional[str] = None,
+        poll: bool = False,
+        poll_interval: float = 2.0,
+        max_polls: int = 64,
+        verbose: bool = False,
+        max_interval: float = 30.0,
+        timeout_seconds: Optional[float] = None,
+    ) -> Tuple[str, str, Optional[str], Optional[str]]:
+        """
+        Create a request, optionally wait until it finishes, and fetch results.
+
+        Waits with poll_until_complete_async, so several providers can run
+        concurrently on one event loop.
+
+        Returns:
+            Tuple of (request_id, status, markdown_report, report_file_path)
+            where the report and path are None unless status is "completed"
+        """
+        request_id, status = await self.acreate_request(query, model, verbose)
+
+        if status == "in_progress" and poll:
+            status = await self.poll_until_complete_async(
+                request_id,
+                timeout=poll_timeout(timeout_seconds, max_polls, max_interval),
+                poll_interval=poll_interval,
+                max_interval=max_interval,
+                verbose=verbose,
+            )
+
+        if status != "completed":
+            return request_id, status, None, None
+
+        report_md, report_file = await self.aget_results(request_id)
+        return request_id, status, report_md, report_file
+
+    def close(self) -> None:
+        """Release network resources held by the provider."""
+        client = getattr(self, "client", None)
+        if client is not None:
+            client.close()
+
+    def resolve_model(self, model: Optional[str] = None) -> str:
+        """Model to use: explicit, else $<NAME>_DEFAULT_MODEL, else provider default."""
+        if model:
+            return model
+        return os.getenv(f"{self.name.upper()}_DEFAULT_MODEL", self._get_default_model())
 
     def _get_default_model(self) -> str:
         """Get default model for this provider."""
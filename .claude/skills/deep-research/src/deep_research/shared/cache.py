@@ -0,0 +1,241 @@
+"""
+Disk cache for completed research reports.
+
+Entries live under ``$RESEARCH_RESULTS_DIR/.cache`` as a ``{key}.json``
+metadata file holding the time it was written, plus a ``{key}.md`` report
+unless the report is already saved in the reports directory. A
+``{key}.refresh`` marker exists while a background refresh is running.
+Writes occasionally sweep the directory, evicting entries past their
+maximum age and the oldest ones while the cache is over its size limit.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Optional, Tuple
+
+from .utils import ensure_reports_dir, write_file
+
+
+def fresh_ttl() -> float:
+    """Seconds a cached report is served without refreshing."""
+    return float(os.getenv("RESEARCH_CACHE_TTL", "600"))
+
+
+def stale_ttl() -> float:
+    """Seconds a cached report may still be served while it is refreshed."""
+    return float(os.getenv("RESEARCH_CACHE_STALE_TTL", "3600"))
+
+
+def max_age() -> float:
+    """Seconds after which any cache entry is evicted."""
+    return float(os.getenv("RESEARCH_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+
+
+def max_bytes() -> float:
+    """Size in bytes the cache directory is trimmed to, oldest entries first."""
+    return float(os.getenv("RESEARCH_CACHE_MAX_MB", "100")) * 1024 * 1024
+
+
+# Seconds between sweeps of the cache directory
+SWEEP_INTERVAL = 3600.0
+
+
+def make_key(*parts: str) -> str:
+    """Build a cache key from its parts, e.g. (provider, model, query)."""
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def cache_dir() -> str:
+    """Ensure the cache directory exists."""
+    path = os.path.join(ensure_reports_dir(), ".cache")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_entry(key: str) -> Tuple[Optional[str], Optional[dict]]:
+    """
+    Look up a cache entry.
+
+    Returns:
+        Tuple of (markdown_report, metadata); the report is None for
+        metadata-only entries, and both are None on a miss, when the
+        cache directory is unusable, or when the entry's saved report
+        file is gone
+    """
+    try:
+        base = os.path.join(cache_dir(), key)
+        with open(f"{base}.json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    try:
+        with open(f"{base}.md", encoding="utf-8") as f:
+            return f.read(), meta
+    except OSError:
+        pass
+    report_file = meta.get("report_file")
+    if not report_file:
+        return None, meta
+    try:
+        with open(report_file, encoding="utf-8") as f:
+            return f.read(), meta
+    except OSError:
+        return None, None
+
+
+def get(key: str) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Look up a cached report.
+
+    Returns:
+        Tuple of (markdown_report, age_in_seconds), or (None, None) on a miss
+    """
+    markdown, meta = get_entry(key)
+    if markdown is None:
+        return None, None
+    return markdown, time.time() - meta.get("timestamp", 0)
+
+
+def put(key: str, markdown: Optional[str], **metadata) -> None:
+    """
+    Store a report; extra keyword arguments are kept in the metadata file.
+
+    With ``markdown=None`` only the metadata is written. A report saved
+    in the reports directory (``report_file`` in the metadata) is not
+    stored again; get_entry reads it from there.
+    """
+    directory = cache_dir()
+    base = os.path.join(directory, key)
+    metadata["timestamp"] = time.time()
+    stored_elsewhere = bool(metadata.get("report_file"))
+    if stored_elsewhere:
+        metadata["report_file"] = os.path.abspath(metadata["report_file"])
+        markdown = None
+
+    files = [(".json", json.dumps(metadata))]
+    if markdown is not None:
+        files.insert(0, (".md", markdown))
+
+    # Write-then-rename so concurrent readers never see a partial entry;
+    # every writer, thread or process, gets its own temp file
+    for suffix, data in files:
+        fd, tmp = tempfile.mkstemp(prefix=f"{key}{suffix}.", suffix=".tmp", dir=directory)
+        os.close(fd)
+        try:
+            write_file(tmp, data)
+            os.replace(tmp, f"{base}{suffix}")
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    if stored_elsewhere:
+        # Drop a copy kept by an earlier put, now that the metadata points
+        # at the saved report
+        try:
+            os.unlink(f"{base}.md")
+        except OSError:
+            pass
+
+    _maybe_sweep(directory)
+
+
+def _maybe_sweep(directory: str) -> None:
+    """Sweep the cache unless that was done in the last SWEEP_INTERVAL."""
+    marker = os.path.join(directory, ".swept")
+    try:
+        if time.time() - os.path.getmtime(marker) < SWEEP_INTERVAL:
+            return
+    except OSError:
+        pass
+    try:
+        write_file(marker, "")
+        sweep(directory)
+    except OSError:
+        pass  # best effort; the next sweep tries again
+
+
+def sweep(directory: Optional[str] = None) -> None:
+    """
+    Evict entries older than max_age(), then the least recently written
+    ones until the cache fits in max_bytes().
+
+    An entry's files (report, metadata, refresh marker, temp files) are
+    evicted together.
+    """
+    if directory is None:
+        directory = cache_dir()
+
+    # key -> [total size, newest mtime, paths]
+    entries = {}
+    for item in os.scandir(directory):
+        if item.name.startswith("."):
+            continue
+        try:
+            stat = item.stat()
+        except OSError:
+            continue
+        entry = entries.setdefault(item.name.split(".", 1)[0], [0, 0.0, []])
+        entry[0] += stat.st_size
+        entry[1] = max(entry[1], stat.st_mtime)
+        entry[2].append(item.path)
+
+    cutoff = time.time() - max_age()
+    budget = max_bytes()
+    total = sum(size for size, _, _ in entries.values())
+    for size, mtime, paths in sorted(entries.values(), key=lambda entry: entry[1]):
+        if mtime >= cutoff and total <= budget:
+            break
+        for path in paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        total -= size
+
+
+def acquire_refresh(key: str, ttl: float) -> bool:
+    """
+    Claim the right to refresh an entry.
+
+    Creates a ``{key}.refresh`` marker with O_EXCL, so only one process
+    refreshes an entry at a time. A marker older than ``ttl`` seconds is
+    taken to belong to a refresh that died, and is taken over.
+
+    Returns:
+        True if the caller should refresh, False if a refresh is running
+        (or the cache directory is unusable)
+    """
+    try:
+        path = os.path.join(cache_dir(), f"{key}.refresh")
+    except OSError:
+        return False
+
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    return False
+                os.unlink(path)
+            except OSError:
+                pass  # removed by its owner meanwhile; try again
+            continue
+        except OSError:
+            return False
+        os.close(fd)
+        return True
+    return False
+
+
+def release_refresh(key: str) -> None:
+    """Drop the refresh marker for an entry, if any."""
+    try:
+        os.unlink(os.path.join(cache_dir(), f"{key}.refresh"))
+    except OSError:
+        pass
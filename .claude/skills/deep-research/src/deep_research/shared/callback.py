@@ -0,0 +1,82 @@
+"""
+Local HTTP listener for provider status callbacks (webhooks).
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from .utils import json_loads
+
+# Largest callback body accepted, in bytes
+MAX_BODY = 1 << 20
+
+# Webhook event types that carry a terminal status
+_EVENT_STATUS = {
+    "completed": "completed",
+    "succeeded": "completed",
+    "failed": "failed",
+    "cancelled": "failed",
+    "expired": "failed",
+}
+
+
+def parse_callback(payload: dict):
+    """
+    Extract (request_id, status) from a callback body.
+
+    Accepts a flat ``{"id": ..., "status": ...}`` body as well as event
+    envelopes such as ``{"type": "response.completed", "data": {"id": ...}}``.
+    Returns (None, None) if the body carries neither.
+    """
+    data = payload.get("data")
+    if isinstance(data, dict) and "type" in payload:
+        event = str(payload["type"]).rsplit(".", 1)[-1]
+        return data.get("id"), _EVENT_STATUS.get(event, "in_progress")
+    return payload.get("id"), payload.get("status")
+
+
+class CallbackServer:
+    """
+    Background HTTP server that forwards status callbacks to a handler.
+
+    Callbacks are not authenticated; handlers must treat them as hints
+    and confirm the status with the upstream.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        on_status: Callable[[str, str], None],
+        host: str = "127.0.0.1",
+    ):
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get("Content-Length", 0))
+                    if not 0 <= length <= MAX_BODY:
+                        raise ValueError(f"bad Content-Length: {length}")
+                    request_id, status = parse_callback(json_loads(self.rfile.read(length)))
+                except (ValueError, AttributeError):
+                    request_id = status = None
+
+                self.send_response(204 if request_id and status else 400)
+                self.end_headers()
+                if request_id and status:
+                    on_status(request_id, status)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def start(self) -> "CallbackServer":
+        """Start serving in a daemon thread."""
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
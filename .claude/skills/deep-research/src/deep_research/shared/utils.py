@@ -4,49 +4,252 @@ Shared utilities for research providers.
 
 import sys
 import os
-import httpx
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
 import json
 
+try:
+    import orjson
+except ImportError:  # optional: pip install deep-research-cli[speedups]
+    orjson = None
+
+
+class HTTPError(Exception):
+    """Non-2xx HTTP response."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"HTTP {status_code}: {message}")
+        self.status_code = status_code
+
+
+class SingleFlight:
+    """
+    Collapse concurrent identical calls into one.
+
+    The first caller for a key runs the function; callers arriving while
+    it is still running wait for and share its result (or exception).
+    Safe to use from any thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args) -> Tuple[Any, bool]:
+        """
+        Run ``fn(*args)`` unless a call for ``key`` is already in flight.
+
+        Returns:
+            Tuple of (result, shared) where shared is True if the result
+            came from another caller's call
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._calls[key] = future
+
+        if owner:
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+
+        return future.result(), not owner
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client():
+    """
+    Return the process-wide httpx.Client, creating it on first use.
+
+    All providers share one HTTP/2 connection pool, so requests to the same
+    host reuse connections and concurrent requests multiplex over them.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            # httpx is imported on first use; it dominates CLI start-up time
+            import httpx
+
+            _shared_client = httpx.Client(
+                http2=True,
+                timeout=300.0,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=120,
+                ),
+            )
+        return _shared_client
+
+
+def close_shared_client() -> None:
+    """Close the shared connection pool, if it was ever opened."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
 
 class HTTPClient:
-    """Simple HTTP client wrapper with timeout and error handling."""
+    """
+    Simple HTTP client wrapper with timeout and error handling.
+
+    A thin adapter over the shared client from get_shared_client(); the
+    timeout is applied per request.
+    """
 
     def __init__(self, timeout: float = 120.0):
         self.timeout = timeout
 
+    @property
+    def _client(self):
+        # Fetched on each request, so creating a provider (e.g. only to serve
+        # a cached report) neither imports httpx nor opens the pool
+        return get_shared_client()
+
+    def close(self) -> None:
+        """
+        Release this client.
+
+        The shared connection pool stays open for other clients; it is
+        closed by close_shared_client().
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def post(self, url: str, headers: dict, json_data: dict) -> dict:
         """POST request with error handling."""
+        import httpx
+
         try:
-            response = httpx.post(
+            response = self._client.post(
                 url,
                 headers=headers,
                 json=json_data,
                 timeout=self.timeout,
             )
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
         except httpx.TimeoutException:
             raise TimeoutError(f"Request to {url} timed out after {self.timeout}s")
         except httpx.HTTPStatusError as e:
-            error_msg = str(e.response.text)
-            raise Exception(f"HTTP {e.response.status_code}: {error_msg}")
+            raise HTTPError(e.response.status_code, str(e.response.text))
 
-    def get(self, url: str, headers: dict) -> dict:
+    def get(
+        self,
+        url: str,
+        headers: dict,
+        params: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> dict:
         """GET request with error handling."""
+        import httpx
+
+        if timeout is None:
+            timeout = self.timeout
         try:
-            response = httpx.get(
+            response = self._client.get(
                 url,
                 headers=headers,
-                timeout=self.timeout,
+                params=params,
+                timeout=timeout,
             )
             response.raise_for_status()
-            return response.json()
+            return json_loads(response.content)
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Request to {url} timed out after {timeout}s")
+        except httpx.HTTPStatusError as e:
+            raise HTTPError(e.response.status_code, str(e.response.text))
+
+    def get_conditional(
+        self,
+        url: str,
+        headers: dict,
+        validators: Optional[dict] = None,
+    ) -> Tuple[Optional[dict], dict]:
+        """
+        Conditional GET with error handling.
+
+        Args:
+            url: URL to fetch
+            headers: Request headers
+            validators: ``ETag``/``Last-Modified`` values from a previous
+                response, sent as ``If-None-Match``/``If-Modified-Since``
+
+        Returns:
+            Tuple of (parsed_body, validators) where the body is None if the
+            server answered 304 Not Modified
+        """
+        import httpx
+
+        headers = dict(headers)
+        if validators:
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            elif "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+        try:
+            response = self._client.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                return None, validators or {}
+            response.raise_for_status()
         except httpx.TimeoutException:
             raise TimeoutError(f"Request to {url} timed out after {self.timeout}s")
         except httpx.HTTPStatusError as e:
-            error_msg = str(e.response.text)
-            raise Exception(f"HTTP {e.response.status_code}: {error_msg}")
+            raise HTTPError(e.response.status_code, str(e.response.text))
+
+        validators = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in response.headers
+        }
+        return json_loads(response.content), validators
+
+    @contextmanager
+    def stream_get(self, url: str, headers: dict) -> Iterator[Iterator[bytes]]:
+        """Streaming GET; yields an iterator over the response body chunks."""
+        import httpx
+
+        try:
+            with self._client.stream(
+                "GET", url, headers=headers, timeout=self.timeout
+            ) as response:
+                if response.is_error:
+                    response.read()
+                    raise HTTPError(response.status_code, response.text)
+                yield response.iter_bytes()
+        except httpx.TimeoutException:
+            raise TimeoutError(f"Request to {url} timed out after {self.timeout}s")
+
+
+def json_loads(data: bytes):
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
 
 
 def get_api_key(provider: str, key_name: str = None) -> str:
@@ -66,13 +269,13 @@ def get_api_key(provider: str, key_name: str = None) -> str:
 def format_error_response(status: str, error: str, verbose: bool = False) -> str:
     """Format error response."""
     if verbose:
-        return json.dumps(
+        return json_dumps(
             {
                 "status": "error",
                 "status_value": status,
                 "message": error,
             },
-            indent=2,
+            indent=True,
         )
     return f"Error ({status}): {error}"
 
@@ -97,35 +300,83 @@ def print_info(msg: str, verbose: bool = False) -> None:
         print(f"ℹ {msg}", file=sys.stderr)
 
 
-def format_markdown_report(
+def iter_markdown_report(
     title: str,
     content: str,
     citations: Optional[list] = None,
     source: Optional[str] = None,
-) -> str:
-    """Format research output as markdown."""
-    md_parts = [f"# {title}\n"]
+) -> Iterator[str]:
+    """
+    Yield the parts of a markdown report.
+
+    The content is yielded as is, never copied or re-formatted; providers
+    write the parts to the report file with write_parts and join them
+    once for the returned report.
+    """
+    yield f"# {title}\n"
 
     if source:
-        md_parts.append(f"> Research conducted with {source}\n")
+        yield f"> Research conducted with {source}\n"
 
-    md_parts.append(content)
+    yield content
 
     if citations:
-        md_parts.append("\n## References\n")
+        yield "\n## References\n"
         for i, citation in enumerate(citations, 1):
             if isinstance(citation, dict):
                 url = citation.get("url", "")
                 title = citation.get("title", "")
                 if url:
-                    md_parts.append(f"[{i}] {title}: {url}\n")
+                    yield f"[{i}] {title}: {url}\n"
                 else:
-                    md_parts.append(f"[{i}] {title}\n")
+                    yield f"[{i}] {title}\n"
             else:
-                md_parts.append(f"[{i}] {citation}\n")
+                yield f"[{i}] {citation}\n"
+
+
+def write_file(path: str, text: str) -> None:
+    """Write text to a file as UTF-8 with direct os.write calls (no text layer)."""
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+
+# Buffers per os.writev call; POSIX guarantees at least 16, Linux allows 1024
+_WRITEV_MAX = 1024
+
 
-    return "".join(md_parts)
+def write_parts(path: str, parts: List[str]) -> None:
+    """
+    Write text parts to a file as UTF-8 without joining them first.
 
+    The encoded parts go to the fd in os.writev calls (os.write per part
+    where writev is unavailable), so the file write needs no copy of the
+    whole text.
+    """
+    chunks = [memoryview(part.encode("utf-8")) for part in parts if part]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if not hasattr(os, "writev"):
+            for data in chunks:
+                while data:
+                    data = data[os.write(fd, data):]
+            return
+        first = 0
+        while first < len(chunks):
+            written = os.writev(fd, chunks[first:first + _WRITEV_MAX])
+            # Skip what was written; a short write may end mid-chunk
+            while first < len(chunks) and written >= len(chunks[first]):
+                written -= len(chunks[first])
+                first += 1
+            if written:
+                chunks[first] = chunks[first][written:]
+    finally:
+        os.close(fd)
 
 def ensure_reports_dir() -> str:
     """Ensure research reports directory exists."""
@@ -0,0 +1,41 @@
+"""
+Shared fixtures: an isolated reports directory and a mocked HTTP upstream.
+"""
+
+import httpx
+import pytest
+
+from deep_research.shared import utils
+
+
+@pytest.fixture(autouse=True)
+def env(tmp_path, monkeypatch):
+    """Point reports and the cache at a temp dir and set fake API keys."""
+    monkeypatch.setenv("RESEARCH_RESULTS_DIR", str(tmp_path / "reports"))
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("DEEPSEEK_API_KEY", "test")
+    monkeypatch.setenv("OPENAI_LONG_POLL_WAIT", "0")
+    return tmp_path
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """
+    Route the shared HTTP client through an httpx.MockTransport.
+
+    Usage: ``upstream(handler)`` where handler maps an httpx.Request to an
+    httpx.Response; returns the list of requests seen.
+    """
+    def install(handler):
+        seen = []
+
+        def record(request):
+            seen.append(request)
+            return handler(request)
+
+        client = httpx.Client(transport=httpx.MockTransport(record))
+        monkeypatch.setattr(utils, "_shared_client", client)
+        return seen
+
+    yield install
+    utils.close_shared_client()
@@ -0,0 +1,120 @@
+"""Adaptive poll intervals: progress resets and the runtime-history floor."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared import cache
+
+
+class RecordingWake:
+    """Stands in for the wake event: records each delay, never sleeps."""
+
+    def __init__(self):
+        self.delays = []
+
+    def wait(self, timeout):
+        self.delays.append(timeout)
+
+    def clear(self):
+        pass
+
+    def set(self):
+        pass
+
+
+def record_history(provider, runtimes, model="o1"):
+    provider._cache_put(provider._runtimes_cache_key(model), None, runtimes=runtimes)
+
+
+def test_first_interval_waits_for_fastest_past_runs():
+    provider = OpenAIProvider(seed=0)
+    record_history(provider, [100.0] * 5)
+    provider._track_request("req", "o1")
+
+    assert provider._next_interval("req", 0, 2.0, 30.0) == pytest.approx(100.0, abs=1.0)
+    # Later polls are plain backoff again
+    assert provider._next_interval("req", 1, 2.0, 30.0) <= 4.0
+
+
+def test_no_floor_until_enough_samples():
+    provider = OpenAIProvider(seed=0)
+    record_history(provider, [100.0] * (provider.MIN_RUNTIME_SAMPLES - 1))
+    provider._track_request("req", "o1")
+
+    assert provider._next_interval("req", 0, 2.0, 30.0) <= 2.0
+
+
+def test_history_is_read_once_per_request(monkeypatch):
+    provider = OpenAIProvider(seed=0)
+    record_history(provider, [100.0] * 5)
+    provider._track_request("req", "o1")
+
+    def no_disk(key):
+        raise AssertionError("poll loop read the disk")
+
+    monkeypatch.setattr(cache, "get_entry", no_disk)
+    for attempt in (0, 1, 0):
+        provider._next_interval("req", attempt, 2.0, 30.0)
+
+
+def test_async_poll_does_not_read_history(upstream, monkeypatch):
+    statuses = iter(["processing", "completed"])
+    upstream(
+        lambda request: httpx.Response(
+            200, json={"id": "resp_1", "status": next(statuses)}
+        )
+    )
+    provider = OpenAIProvider(seed=0)
+    provider._track_request("resp_1", "o1")
+    load_runtimes = provider._load_runtimes
+    loads = []
+    monkeypatch.setattr(
+        provider,
+        "_load_runtimes",
+        lambda model: loads.append(model) or load_runtimes(model),
+    )
+
+    status = asyncio.run(
+        provider.poll_until_complete_async(
+            "resp_1", poll_interval=0.01, max_interval=0.01
+        )
+    )
+
+    assert status == "completed"
+    # Only completion touches the history, to record this runtime
+    assert loads == ["o1"]
+
+
+def test_completion_is_added_to_history(upstream):
+    upstream(
+        lambda request: httpx.Response(
+            200, json={"id": "resp_1", "status": "completed"}
+        )
+    )
+    provider = OpenAIProvider()
+    provider._track_request("resp_1", "o1")
+
+    provider.check_status("resp_1")
+
+    assert len(provider._load_runtimes("o1")) == 1
+
+
+def test_progress_restarts_the_backoff(upstream):
+    statuses = iter(["queued", "queued", "queued", "searching", "completed"])
+    upstream(
+        lambda request: httpx.Response(
+            200, json={"id": "resp_1", "status": next(statuses)}
+        )
+    )
+    provider = OpenAIProvider(seed=3)
+    provider._wake = RecordingWake()
+
+    assert provider.poll_until_complete("resp_1") == "completed"
+
+    expected = OpenAIProvider(seed=3)
+    assert provider._wake.delays == [
+        expected._backoff_delay(attempt, 2.0, 30.0) for attempt in (0, 1, 2, 0)
+    ]
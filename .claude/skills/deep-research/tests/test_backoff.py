@@ -0,0 +1,66 @@
+"""Poll scheduling: full-jitter backoff from a seeded per-provider RNG."""
+
+import httpx
+
+from deep_research.providers.deepseek import DeepSeekProvider
+from deep_research.providers.openai import OpenAIProvider
+
+
+def schedule(provider, n=10, base=2.0, max_delay=30.0):
+    return [provider._backoff_delay(attempt, base, max_delay) for attempt in range(n)]
+
+
+class RecordingWake:
+    """Stands in for the wake event: records each delay, never sleeps."""
+
+    def __init__(self):
+        self.delays = []
+
+    def wait(self, timeout):
+        self.delays.append(timeout)
+
+    def clear(self):
+        pass
+
+    def set(self):
+        pass
+
+
+def polled_delays(upstream, seed, request_id):
+    statuses = iter(["processing"] * 6 + ["completed"])
+    upstream(
+        lambda request: httpx.Response(
+            200, json={"id": request_id, "status": next(statuses)}
+        )
+    )
+    provider = OpenAIProvider(seed=seed)
+    provider._wake = RecordingWake()
+
+    assert provider.poll_until_complete(request_id) == "completed"
+    return provider._wake.delays
+
+
+def test_same_seed_same_schedule():
+    assert schedule(OpenAIProvider(seed=42)) == schedule(OpenAIProvider(seed=42))
+    assert schedule(DeepSeekProvider(seed=42)) == schedule(DeepSeekProvider(seed=42))
+
+
+def test_different_seed_different_schedule():
+    assert schedule(OpenAIProvider(seed=1)) != schedule(OpenAIProvider(seed=2))
+
+
+def test_delays_within_capped_exponential_bounds():
+    provider = OpenAIProvider(seed=0)
+    for attempt, delay in enumerate(schedule(provider, n=20)):
+        cap = min(30.0, 2.0 * 2 ** min(attempt, provider.MAX_BACKOFF_EXPONENT))
+        assert 0 <= delay <= cap
+
+
+def test_poll_loop_follows_the_seeded_schedule(upstream):
+    first = polled_delays(upstream, seed=7, request_id="resp_1")
+    # A new request, so the first one's cached status doesn't apply
+    second = polled_delays(upstream, seed=7, request_id="resp_2")
+
+    assert len(first) == 6
+    assert first == second
+    assert first == schedule(OpenAIProvider(seed=7), n=6)
@@ -0,0 +1,121 @@
+"""Webhook callbacks: parsing, the listener, and waking poll loops."""
+
+import http.client
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared.callback import MAX_BODY, CallbackServer, parse_callback
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ({"id": "resp_1", "status": "completed"}, ("resp_1", "completed")),
+        (
+            {"type": "response.completed", "data": {"id": "resp_1"}},
+            ("resp_1", "completed"),
+        ),
+        (
+            {"type": "response.cancelled", "data": {"id": "resp_1"}},
+            ("resp_1", "failed"),
+        ),
+        (
+            {"type": "response.queued", "data": {"id": "resp_1"}},
+            ("resp_1", "in_progress"),
+        ),
+        ({"unrelated": True}, (None, None)),
+    ],
+)
+def test_parse_callback(payload, expected):
+    assert parse_callback(payload) == expected
+
+
+@pytest.fixture
+def server():
+    received = []
+    forwarded = threading.Event()
+
+    def on_status(*args):
+        received.append(args)
+        forwarded.set()
+
+    server = CallbackServer(0, on_status).start()
+    server.received = received
+    server.forwarded = forwarded
+    yield server
+    server.close()
+
+
+def post(server, body, headers=None):
+    connection = http.client.HTTPConnection(
+        *server._server.server_address[:2], timeout=5
+    )
+    try:
+        connection.request("POST", "/", body=body, headers=headers or {})
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+def test_valid_callback_is_forwarded(server):
+    body = json.dumps({"id": "resp_1", "status": "completed"})
+
+    assert post(server, body) == 204
+    # The handler forwards the callback after answering it
+    assert server.forwarded.wait(5)
+    assert server.received == [("resp_1", "completed")]
+
+
+@pytest.mark.parametrize("length", ["abc", "-1", str(MAX_BODY + 1)])
+def test_bad_content_length_is_rejected(server, length):
+    status = post(server, "{}", headers={"Content-Length": length})
+
+    assert status == 400
+    assert server.received == []
+
+
+@pytest.mark.parametrize("body", ["not json", "[1, 2]", json.dumps({"id": "resp_1"})])
+def test_bad_body_is_rejected(server, body):
+    assert post(server, body) == 400
+    assert server.received == []
+
+
+def status_sequence(*statuses):
+    statuses = iter(statuses)
+    last = [None]
+
+    def handler(request):
+        last[0] = next(statuses, last[0])
+        return httpx.Response(200, json={"id": "resp_1", "status": last[0]})
+
+    return handler
+
+
+def test_callback_wakes_the_poll_loop(upstream):
+    seen = upstream(status_sequence("processing", "completed"))
+    provider = OpenAIProvider()
+    threading.Timer(0.2, provider.notify_complete, ("resp_1", "completed")).start()
+
+    started = time.monotonic()
+    status = provider.poll_until_complete("resp_1", poll_interval=30, max_interval=30)
+
+    assert status == "completed"
+    assert time.monotonic() - started < 1.0
+    assert len(seen) == 2
+
+
+def test_callback_status_is_not_trusted(upstream):
+    upstream(status_sequence("processing"))
+    provider = OpenAIProvider()
+    threading.Timer(0.2, provider.notify_complete, ("resp_1", "completed")).start()
+
+    status = provider.poll_until_complete(
+        "resp_1", poll_interval=30, max_interval=30, timeout_seconds=0.5
+    )
+
+    assert status == "in_progress"
@@ -0,0 +1,57 @@
+"""cancel(): waiting poll loops return at once."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+
+from deep_research.providers.openai import OpenAIProvider
+
+
+def processing(request):
+    return httpx.Response(200, json={"id": "resp_1", "status": "processing"})
+
+
+def cancel_later(provider, delay=0.2):
+    threading.Timer(delay, provider.cancel).start()
+
+
+def test_cancel_interrupts_sync_poll(upstream):
+    upstream(processing)
+    provider = OpenAIProvider()
+    cancel_later(provider)
+
+    started = time.monotonic()
+    status = provider.poll_until_complete("resp_1", poll_interval=30, max_interval=30)
+
+    assert status == "cancelled"
+    assert time.monotonic() - started < 1.0
+
+
+def test_cancel_interrupts_async_polls(upstream):
+    upstream(processing)
+    provider = OpenAIProvider()
+    cancel_later(provider)
+
+    async def main():
+        return await provider.poll_many(
+            ["resp_1", "resp_2"], poll_interval=30, max_interval=30
+        )
+
+    started = time.monotonic()
+    results = asyncio.run(main())
+
+    assert results == {"resp_1": "cancelled", "resp_2": "cancelled"}
+    assert time.monotonic() - started < 1.0
+
+
+def test_async_poll_started_after_cancel_returns_at_once(upstream):
+    seen = upstream(processing)
+    provider = OpenAIProvider()
+    provider.cancel()
+
+    status = asyncio.run(provider.poll_until_complete_async("resp_1", poll_interval=30))
+
+    assert status == "cancelled"
+    assert seen == []
@@ -0,0 +1,68 @@
+"""Conditional status GETs: unchanged bodies come back as 304."""
+
+import httpx
+
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared.utils import HTTPClient
+
+
+def versioned(statuses, header="ETag"):
+    """Handler serving one status per version; 304 while the client has the latest."""
+    state = {"version": 0}
+    request_header = "If-None-Match" if header == "ETag" else "If-Modified-Since"
+
+    def handler(request):
+        tag = f'"v{state["version"]}"'
+        if request.headers.get(request_header) == tag:
+            return httpx.Response(304)
+        body = {"id": "resp_1", "status": statuses[state["version"]]}
+        return httpx.Response(200, json=body, headers={header: tag})
+
+    return handler, state
+
+
+def test_unchanged_status_is_answered_with_304(upstream):
+    handler, _ = versioned(["processing"])
+    seen = upstream(handler)
+    provider = OpenAIProvider()
+
+    assert provider.check_status("resp_1", max_age=0) == "in_progress"
+    assert provider.check_status("resp_1", max_age=0) == "in_progress"
+
+    assert "If-None-Match" not in seen[0].headers
+    assert seen[1].headers["If-None-Match"] == '"v0"'
+
+
+def test_changed_status_is_fetched_again(upstream):
+    handler, state = versioned(["processing", "completed"])
+    upstream(handler)
+    provider = OpenAIProvider()
+    assert provider.check_status("resp_1", max_age=0) == "in_progress"
+
+    state["version"] = 1
+
+    assert provider.check_status("resp_1", max_age=0) == "completed"
+
+
+def test_last_modified_is_used_without_etag(upstream):
+    handler, _ = versioned(["processing"], header="Last-Modified")
+    seen = upstream(handler)
+    provider = OpenAIProvider()
+
+    provider.check_status("resp_1", max_age=0)
+    assert provider.check_status("resp_1", max_age=0) == "in_progress"
+    assert seen[1].headers["If-Modified-Since"] == '"v0"'
+
+
+def test_get_conditional_returns_no_body_on_304(upstream):
+    handler, _ = versioned(["processing"])
+    upstream(handler)
+    client = HTTPClient()
+
+    body, validators = client.get_conditional("https://example.com/r", {})
+    again, same = client.get_conditional("https://example.com/r", {}, validators)
+
+    assert body == {"id": "resp_1", "status": "processing"}
+    assert validators == {"ETag": '"v0"'}
+    assert again is None
+    assert same == validators
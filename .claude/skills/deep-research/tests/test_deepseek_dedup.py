@@ -0,0 +1,59 @@
+"""De-duplication of identical in-flight DeepSeek requests."""
+
+import threading
+import time
+
+import httpx
+
+from deep_research.providers.deepseek import DeepSeekProvider
+
+
+def slow_completion(request):
+    # Long enough for every caller to join the in-flight request
+    time.sleep(0.3)
+    return httpx.Response(200, json={"choices": [{"message": {"content": "Answer"}}]})
+
+
+def create_concurrently(queries):
+    providers = [DeepSeekProvider() for _ in queries]
+    results = [None] * len(queries)
+
+    def create(i):
+        results[i] = providers[i].create_request(queries[i])
+
+    threads = [threading.Thread(target=create, args=(i,)) for i in range(len(queries))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return providers, results
+
+
+def test_identical_requests_share_one_call(upstream):
+    seen = upstream(slow_completion)
+
+    providers, results = create_concurrently(["q"] * 3)
+
+    assert len(seen) == 1
+    request_ids = [request_id for request_id, _ in results]
+    assert len(set(request_ids)) == 3
+    for provider, request_id in zip(providers, request_ids):
+        assert "Answer" in provider.get_results(request_id)[0]
+
+
+def test_different_queries_are_not_shared(upstream):
+    seen = upstream(slow_completion)
+
+    create_concurrently(["q1", "q2"])
+
+    assert len(seen) == 2
+
+
+def test_sequential_requests_are_sent_again(upstream):
+    seen = upstream(slow_completion)
+    provider = DeepSeekProvider()
+
+    provider.create_request("q")
+    provider.create_request("q")
+
+    assert len(seen) == 2
@@ -0,0 +1,93 @@
+"""OpenAI long-polling: fallback, deadline and cancellation."""
+
+import threading
+import time
+
+import httpx
+
+from deep_research.providers.openai import OpenAIProvider
+
+
+def status_response(status):
+    return httpx.Response(200, json={"id": "resp_1", "status": status})
+
+
+def held(statuses):
+    """Handler holding each ?wait request for its full wait."""
+    statuses = iter(statuses)
+    lock = threading.Lock()
+
+    def handler(request):
+        if "wait" in request.url.params:
+            time.sleep(float(request.url.params["wait"]))
+        with lock:
+            return status_response(next(statuses))
+
+    return handler
+
+
+def test_falls_back_when_wait_is_ignored(upstream, monkeypatch):
+    monkeypatch.setenv("OPENAI_LONG_POLL_WAIT", "5")
+    statuses = iter(["processing"] * 3 + ["completed"])
+    seen = upstream(lambda request: status_response(next(statuses)))
+    provider = OpenAIProvider()
+
+    status = provider.poll_until_complete(
+        "resp_1", poll_interval=0.01, max_interval=0.05
+    )
+    assert status == "completed"
+    assert provider.long_poll_wait == 0
+    # Only the first request asked the server to hold it
+    assert ["wait" in request.url.params for request in seen][:2] == [True, False]
+
+
+def test_held_requests_keep_long_polling(upstream, monkeypatch):
+    monkeypatch.setenv("OPENAI_LONG_POLL_WAIT", "1")
+    seen = upstream(held(["processing", "completed"]))
+    provider = OpenAIProvider()
+
+    assert provider.poll_until_complete("resp_1") == "completed"
+    assert provider.long_poll_wait == 1
+    assert all("wait" in request.url.params for request in seen)
+
+
+def test_never_holds_past_the_deadline(upstream, monkeypatch):
+    monkeypatch.setenv("OPENAI_LONG_POLL_WAIT", "60")
+    seen = upstream(held(["processing"] * 3))
+    provider = OpenAIProvider()
+
+    started = time.monotonic()
+    assert provider.poll_until_complete("resp_1", timeout_seconds=1.5) == "in_progress"
+    assert time.monotonic() - started < 3.0
+    assert seen[0].url.params["wait"] == "1"
+
+
+def test_cancel_interrupts_held_request(upstream, monkeypatch):
+    monkeypatch.setenv("OPENAI_LONG_POLL_WAIT", "3")
+    upstream(held(["processing"] * 2))
+    provider = OpenAIProvider()
+    threading.Timer(0.2, provider.cancel).start()
+
+    started = time.monotonic()
+    assert provider.poll_until_complete("resp_1") == "cancelled"
+    assert time.monotonic() - started < 1.0
+
+
+def test_concurrent_pollers_on_one_provider(upstream, monkeypatch):
+    monkeypatch.setenv("OPENAI_LONG_POLL_WAIT", "1")
+    upstream(held(["processing", "processing", "completed", "completed"]))
+    provider = OpenAIProvider()
+    results = {}
+
+    def poll(request_id):
+        results[request_id] = provider.poll_until_complete(
+            request_id, timeout_seconds=10
+        )
+
+    threads = [threading.Thread(target=poll, args=(rid,)) for rid in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert results == {"a": "completed", "b": "completed"}
@@ -0,0 +1,33 @@
+"""Rendering research output as markdown parts."""
+
+from deep_research.shared.utils import iter_markdown_report
+
+
+def test_content_is_passed_through_unchanged():
+    content = "Body " * 1000
+
+    parts = list(iter_markdown_report("Title", content, source="Test"))
+
+    assert any(part is content for part in parts)
+    assert "".join(parts) == f"# Title\n> Research conducted with Test\n{content}"
+
+
+def test_citations_are_listed():
+    citations = [
+        {"title": "Paper", "url": "https://example.com"},
+        {"title": "Book"},
+        "Plain reference",
+    ]
+
+    report = "".join(iter_markdown_report("Title", "Body", citations))
+
+    assert report.endswith(
+        "\n## References\n"
+        "[1] Paper: https://example.com\n"
+        "[2] Book\n"
+        "[3] Plain reference\n"
+    )
+
+
+def test_no_references_section_without_citations():
+    assert "References" not in "".join(iter_markdown_report("Title", "Body", []))
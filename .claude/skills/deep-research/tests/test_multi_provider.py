@@ -0,0 +1,95 @@
+"""Multi-provider fan-out in the CLI."""
+
+import argparse
+import threading
+
+import httpx
+import pytest
+
+from deep_research import research
+
+REPORTS = {"openai": "OpenAI findings", "deepseek": "DeepSeek answer"}
+
+
+def make_args(**overrides):
+    args = dict(
+        no_cache=False,
+        model=None,
+        poll=True,
+        poll_interval=0.01,
+        max_polls=64,
+        max_interval=0.05,
+        timeout=None,
+        verbose=False,
+        callback_url=None,
+        callback_port=None,
+        output=None,
+    )
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def providers_handler(created=None):
+    """Answer both providers; ``created`` is waited on by each create call."""
+
+    def handler(request):
+        if request.method == "POST" and created is not None:
+            created.wait()
+        if "deepseek" in request.url.host:
+            message = {"content": REPORTS["deepseek"]}
+            return httpx.Response(200, json={"choices": [{"message": message}]})
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "resp_1", "status": "processing"})
+        content = [{"research": REPORTS["openai"], "citations": []}]
+        return httpx.Response(
+            200, json={"id": "resp_1", "status": "completed", "content": content}
+        )
+
+    return handler
+
+
+def test_reports_printed_in_provider_order(upstream, capsys):
+    upstream(providers_handler())
+
+    research.run_multi_provider(["openai", "deepseek"], "q", make_args())
+
+    out = capsys.readouterr().out
+    assert out.index(REPORTS["openai"]) < out.index(REPORTS["deepseek"])
+    assert "\n---\n" in out
+
+
+def test_providers_run_concurrently(upstream):
+    # Each create call blocks until both have arrived; run one after the
+    # other, the barrier would break
+    upstream(providers_handler(threading.Barrier(2, timeout=5)))
+
+    research.run_multi_provider(["openai", "deepseek"], "q", make_args())
+
+
+def test_cached_reports_skip_the_upstream(upstream, capsys):
+    upstream(providers_handler())
+    research.run_multi_provider(["openai", "deepseek"], "q", make_args())
+    capsys.readouterr()
+
+    seen = upstream(providers_handler())
+    research.run_multi_provider(["openai", "deepseek"], "q", make_args())
+    assert seen == []
+    assert REPORTS["deepseek"] in capsys.readouterr().out
+
+
+def test_one_failure_still_prints_the_others(upstream, capsys):
+    handler = providers_handler()
+
+    def failing_deepseek(request):
+        if "deepseek" in request.url.host:
+            return httpx.Response(500, text="upstream down")
+        return handler(request)
+
+    upstream(failing_deepseek)
+    with pytest.raises(SystemExit) as exit_info:
+        research.run_multi_provider(["openai", "deepseek"], "q", make_args())
+
+    assert exit_info.value.code == 1
+    captured = capsys.readouterr()
+    assert REPORTS["openai"] in captured.out
+    assert "deepseek" in captured.err
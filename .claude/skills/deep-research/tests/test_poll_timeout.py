@@ -0,0 +1,74 @@
+"""Poll budgets measured on the monotonic clock."""
+
+import asyncio
+import time
+
+import httpx
+
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared.base import poll_timeout
+
+
+def processing(request):
+    return httpx.Response(200, json={"id": "resp_1", "status": "processing"})
+
+
+def test_poll_timeout_prefers_seconds():
+    assert poll_timeout(90.0, 64, 30.0) == 90.0
+    assert poll_timeout(None, 64, 30.0) == 64 * 30.0
+
+
+def test_sync_poll_gives_up_after_timeout(upstream, capsys):
+    upstream(processing)
+    provider = OpenAIProvider()
+
+    started = time.monotonic()
+    status = provider.poll_until_complete(
+        "resp_1", poll_interval=0.01, max_interval=0.05, timeout_seconds=0.3
+    )
+    elapsed = time.monotonic() - started
+
+    assert status == "in_progress"
+    assert 0.3 <= elapsed < 1.0
+    assert "Timeout after" in capsys.readouterr().err
+
+
+def test_last_wait_is_clamped_to_the_deadline(upstream):
+    upstream(processing)
+    provider = OpenAIProvider(seed=0)
+
+    started = time.monotonic()
+    status = provider.poll_until_complete(
+        "resp_1", poll_interval=30, max_interval=30, timeout_seconds=0.3
+    )
+
+    assert status == "in_progress"
+    assert time.monotonic() - started < 1.0
+
+
+def test_max_polls_sets_the_budget_without_timeout(upstream):
+    upstream(processing)
+    provider = OpenAIProvider()
+
+    started = time.monotonic()
+    status = provider.poll_until_complete(
+        "resp_1", poll_interval=0.01, max_polls=4, max_interval=0.05
+    )
+
+    assert status == "in_progress"
+    assert time.monotonic() - started < 1.0
+
+
+def test_async_poll_gives_up_after_timeout(upstream):
+    upstream(processing)
+    provider = OpenAIProvider()
+
+    started = time.monotonic()
+    status = asyncio.run(
+        provider.poll_until_complete_async(
+            "resp_1", timeout=0.3, poll_interval=0.01, max_interval=0.05
+        )
+    )
+
+    assert status == "in_progress"
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,150 @@
+"""Disk cache: stale-while-revalidate hits, refresh markers, concurrent writes."""
+
+import argparse
+import os
+import threading
+import time
+import types
+
+from deep_research import research
+from deep_research.providers.deepseek import DeepSeekProvider
+from deep_research.shared import cache
+from deep_research.shared.base import BaseProviderMixin
+
+
+def make_args(**overrides):
+    args = dict(no_cache=False, model=None, poll_interval=2.0, max_interval=30.0)
+    args.update(max_polls=64, timeout=None)
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+def spawn_recorder(monkeypatch):
+    """Record background refreshes instead of starting processes."""
+    spawned = []
+    fake = types.SimpleNamespace(
+        Popen=lambda cmd, **kwargs: spawned.append(cmd), DEVNULL=None
+    )
+    monkeypatch.setattr(research, "subprocess", fake)
+    return spawned
+
+
+def cache_report(provider, query="q", report="# Cached"):
+    research.store_cached_report(provider, query, make_args(), report, None)
+
+
+def test_put_and_get_roundtrip():
+    cache.put("k", "# Report", provider="openai")
+
+    markdown, age = cache.get("k")
+    assert markdown == "# Report"
+    assert 0 <= age < 5
+    assert cache.get_entry("k")[1]["provider"] == "openai"
+
+
+def test_fresh_hit_does_not_refresh(monkeypatch, capsys):
+    spawned = spawn_recorder(monkeypatch)
+    provider = DeepSeekProvider()
+    cache_report(provider)
+
+    assert research.lookup_cached_report(provider, "q", make_args()) == "# Cached"
+    assert spawned == []
+
+
+def test_stale_hit_is_served_and_refreshed_once(monkeypatch, capsys):
+    monkeypatch.setenv("RESEARCH_CACHE_TTL", "0")
+    spawned = spawn_recorder(monkeypatch)
+    provider = DeepSeekProvider()
+    cache_report(provider)
+
+    assert research.lookup_cached_report(provider, "q", make_args()) == "# Cached"
+    assert research.lookup_cached_report(provider, "q", make_args()) == "# Cached"
+
+    assert len(spawned) == 1
+    assert spawned[0][-2:] == ["--", "q"]
+    assert "refresh already running" in capsys.readouterr().err
+
+
+def test_storing_the_refreshed_report_releases_the_marker(monkeypatch):
+    monkeypatch.setenv("RESEARCH_CACHE_TTL", "0")
+    spawned = spawn_recorder(monkeypatch)
+    provider = DeepSeekProvider()
+    cache_report(provider)
+
+    research.lookup_cached_report(provider, "q", make_args())
+    cache_report(provider, report="# Refreshed")
+    assert research.lookup_cached_report(provider, "q", make_args()) == "# Refreshed"
+    assert len(spawned) == 2
+
+
+def test_expired_entry_is_a_miss(monkeypatch):
+    monkeypatch.setenv("RESEARCH_CACHE_STALE_TTL", "0")
+    provider = DeepSeekProvider()
+    cache_report(provider)
+
+    assert research.lookup_cached_report(provider, "q", make_args()) is None
+
+
+def test_no_cache_skips_lookup():
+    provider = DeepSeekProvider()
+    cache_report(provider)
+
+    assert (
+        research.lookup_cached_report(provider, "q", make_args(no_cache=True)) is None
+    )
+
+
+def test_refresh_marker_is_exclusive():
+    assert cache.acquire_refresh("k", ttl=60)
+    assert not cache.acquire_refresh("k", ttl=60)
+
+    cache.release_refresh("k")
+    assert cache.acquire_refresh("k", ttl=60)
+
+
+def test_expired_refresh_marker_is_taken_over():
+    assert cache.acquire_refresh("k", ttl=60)
+    marker = os.path.join(cache.cache_dir(), "k.refresh")
+    past = time.time() - 120
+    os.utime(marker, (past, past))
+
+    assert cache.acquire_refresh("k", ttl=60)
+    assert not cache.acquire_refresh("k", ttl=60)
+
+
+def test_concurrent_puts_leave_a_valid_entry():
+    errors = []
+
+    def write(i):
+        try:
+            for _ in range(20):
+                cache.put("k", None, writer=i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert errors == []
+    assert cache.get_entry("k")[1]["writer"] in range(8)
+    assert not [name for name in os.listdir(cache.cache_dir()) if name.endswith(".tmp")]
+
+
+def test_concurrent_runtimes_are_all_recorded():
+    provider = BaseProviderMixin()
+    for i in range(10):
+        provider._track_request(f"r{i}", "m")
+
+    threads = [
+        threading.Thread(target=provider._record_runtime, args=(f"r{i}",))
+        for i in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    assert len(provider._load_runtimes("m")) == 10
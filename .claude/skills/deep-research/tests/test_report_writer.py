@@ -0,0 +1,69 @@
+"""Writing rendered report parts straight to the report file."""
+
+import os
+
+import httpx
+import pytest
+
+from deep_research.providers.deepseek import DeepSeekProvider
+from deep_research.shared import utils
+
+PARTS = ["# Title\n", "", "Körper – ünïcode ✓\n", "[1] ref\n"] * 3
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def test_parts_are_written_in_order(tmp_path):
+    path = tmp_path / "report.md"
+    utils.write_parts(str(path), PARTS)
+
+    assert read(path) == "".join(PARTS)
+
+
+def test_more_parts_than_one_writev_call(tmp_path):
+    parts = [f"[{i}] citation\n" for i in range(utils._WRITEV_MAX * 2 + 5)]
+    path = tmp_path / "report.md"
+    utils.write_parts(str(path), parts)
+
+    assert read(path) == "".join(parts)
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="needs os.writev")
+def test_short_writes_are_resumed(tmp_path, monkeypatch):
+    writev = os.writev
+
+    def short_writev(fd, buffers):
+        # Write at most 5 bytes, splitting multi-byte characters too
+        return writev(fd, [bytes(b"".join(bytes(b) for b in buffers)[:5])])
+
+    monkeypatch.setattr(os, "writev", short_writev)
+    path = tmp_path / "report.md"
+    utils.write_parts(str(path), PARTS)
+
+    assert read(path) == "".join(PARTS)
+
+
+def test_without_writev(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "writev", raising=False)
+    path = tmp_path / "report.md"
+    utils.write_parts(str(path), PARTS)
+
+    assert read(path) == "".join(PARTS)
+
+
+def test_saved_report_matches_returned_report(upstream):
+    upstream(
+        lambda request: httpx.Response(
+            200, json={"choices": [{"message": {"content": "Answer ✓"}}]}
+        )
+    )
+    provider = DeepSeekProvider()
+    request_id, _ = provider.create_request("q")
+
+    markdown, report_file = provider.get_results(request_id)
+
+    assert "Answer ✓" in markdown
+    assert read(report_file) == markdown
@@ -0,0 +1,61 @@
+"""The process-wide HTTP client is shared and created on first request."""
+
+import os
+import subprocess
+import sys
+
+import httpx
+
+from deep_research.providers.deepseek import DeepSeekProvider
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared import utils
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def test_creating_providers_opens_no_client(monkeypatch):
+    monkeypatch.setattr(utils, "_shared_client", None)
+
+    OpenAIProvider()
+    DeepSeekProvider()
+
+    assert utils._shared_client is None
+
+
+def test_creating_a_provider_does_not_import_httpx():
+    code = (
+        "import sys\n"
+        "from deep_research.research import get_provider\n"
+        "get_provider('openai')\n"
+        "print('httpx' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": SRC, "OPENAI_API_KEY": "test"},
+    ).stdout
+
+    assert out.strip() == "False"
+
+
+def test_providers_share_one_client(upstream):
+    upstream(lambda request: httpx.Response(200, json={}))
+
+    openai, deepseek = OpenAIProvider(), DeepSeekProvider()
+
+    assert openai.client._client is deepseek.client._client
+    assert openai.client._client is utils._shared_client
+
+
+def test_client_is_reopened_after_close(monkeypatch):
+    monkeypatch.setattr(utils, "_shared_client", None)
+    first = utils.get_shared_client()
+    utils.close_shared_client()
+
+    second = utils.get_shared_client()
+    utils.close_shared_client()
+
+    assert first is not second
+    assert first.is_closed
@@ -0,0 +1,135 @@
+"""SingleFlight: concurrent identical calls share one execution."""
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from deep_research.providers import openai
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared.utils import SingleFlight
+
+
+def run_concurrently(n, target):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads
+
+
+def test_concurrent_calls_coalesce():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    def caller():
+        results.append(flight.do("key", fn))
+
+    threads = run_concurrently(5, caller)
+    # Let every caller reach do() before the owner finishes
+    threading.Event().wait(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert all(value == "value" for value, _ in results)
+
+
+def test_exception_reaches_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def fn():
+        release.wait(5)
+        raise ValueError("boom")
+
+    def caller():
+        try:
+            flight.do("key", fn)
+        except ValueError as e:
+            errors.append(e)
+
+    threads = run_concurrently(3, caller)
+    threading.Event().wait(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(errors) == 3
+
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight()
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return len(calls)
+
+    assert flight.do("key", fn) == (1, False)
+    assert flight.do("key", fn) == (2, False)
+
+
+def test_key_is_released_after_failure():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: "ok") == ("ok", False)
+
+
+def test_concurrent_status_checks_share_one_request(upstream):
+    def slow_status(request):
+        time.sleep(0.3)
+        return httpx.Response(200, json={"id": "resp_1", "status": "processing"})
+
+    seen = upstream(slow_status)
+    provider = OpenAIProvider()
+    statuses = []
+
+    threads = run_concurrently(
+        4, lambda: statuses.append(provider.check_status("resp_1", max_age=0))
+    )
+    for thread in threads:
+        thread.join(5)
+
+    assert statuses == ["in_progress"] * 4
+    assert len(seen) == 1
+
+
+def test_concurrent_results_share_one_download(upstream, monkeypatch):
+    monkeypatch.setattr(openai, "ijson", None)
+
+    def slow_results(request):
+        time.sleep(0.3)
+        content = [{"research": "Report", "citations": []}]
+        return httpx.Response(
+            200, json={"id": "resp_1", "status": "completed", "content": content}
+        )
+
+    seen = upstream(slow_results)
+    provider = OpenAIProvider()
+    reports = []
+
+    threads = run_concurrently(
+        4, lambda: reports.append(provider.get_results("resp_1")[0])
+    )
+    for thread in threads:
+        thread.join(5)
+
+    assert len(reports) == 4
+    assert len(set(reports)) == 1
+    assert len(seen) == 1
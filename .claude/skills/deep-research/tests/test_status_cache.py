@@ -0,0 +1,195 @@
+"""Status and results caching, and eviction from the disk cache."""
+
+import os
+import time
+
+import httpx
+import pytest
+
+from deep_research.providers.deepseek import DeepSeekProvider
+from deep_research.providers.openai import OpenAIProvider
+from deep_research.shared import cache
+
+
+def research(status, report="# Findings"):
+    """Handler answering every request with one research resource."""
+    body = {"id": "resp_1", "status": status}
+    if status == "completed":
+        body["content"] = [{"research": report, "citations": []}]
+    return lambda request: httpx.Response(200, json=body)
+
+
+def completion(request):
+    return httpx.Response(200, json={"choices": [{"message": {"content": "Answer"}}]})
+
+
+def age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_in_progress_status_is_memoised_briefly(upstream):
+    seen = upstream(research("processing"))
+    provider = OpenAIProvider()
+
+    assert provider.check_status("resp_1") == "in_progress"
+    assert provider.check_status("resp_1") == "in_progress"
+    assert len(seen) == 1
+    # Poll loops bypass the memo
+    assert provider.check_status("resp_1", max_age=0) == "in_progress"
+    assert len(seen) == 2
+
+
+def test_terminal_status_is_cached_on_disk(upstream):
+    seen = upstream(research("completed"))
+    assert OpenAIProvider().check_status("resp_1") == "completed"
+
+    assert OpenAIProvider().check_status("resp_1", max_age=0) == "completed"
+    assert len(seen) == 1
+
+
+def test_disk_is_only_consulted_on_first_lookup(upstream, monkeypatch):
+    upstream(research("processing"))
+    provider = OpenAIProvider()
+    lookups = []
+    get_entry = cache.get_entry
+    monkeypatch.setattr(
+        cache, "get_entry", lambda key: lookups.append(key) or get_entry(key)
+    )
+
+    for _ in range(3):
+        provider.check_status("resp_1", max_age=0)
+    assert len(lookups) == 1
+
+
+def test_results_are_downloaded_once(upstream):
+    seen = upstream(research("completed", report="Quantum"))
+    provider = OpenAIProvider()
+    assert provider.check_status("resp_1") == "completed"
+
+    first, report_file = provider.get_results("resp_1")
+    second, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Quantum" in first
+    assert second == first
+    assert len(seen) == 2  # one status check, one results download
+
+
+def test_saved_reports_are_not_stored_twice(upstream):
+    upstream(research("completed"))
+    provider = OpenAIProvider()
+    provider.check_status("resp_1")
+
+    _, report_file = provider.get_results("resp_1")
+
+    assert report_file
+    assert not [name for name in os.listdir(cache.cache_dir()) if name.endswith(".md")]
+
+
+def test_deleted_report_file_is_downloaded_again(upstream):
+    seen = upstream(research("completed", report="Quantum"))
+    provider = OpenAIProvider()
+    provider.check_status("resp_1")
+    _, report_file = provider.get_results("resp_1")
+    os.unlink(report_file)
+    downloads = len(seen)
+
+    markdown, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Quantum" in markdown
+    assert len(seen) > downloads
+
+
+def test_results_of_unfinished_requests_are_not_cached(upstream):
+    seen = upstream(research("processing"))
+    provider = OpenAIProvider()
+    provider.check_status("resp_1")
+
+    provider.get_results("resp_1")
+    downloads = len(seen)
+    provider.get_results("resp_1")
+    assert len(seen) > downloads
+
+
+def test_unusable_cache_dir_is_not_fatal(upstream, tmp_path, monkeypatch):
+    # A regular file where the reports directory should be
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setenv("RESEARCH_RESULTS_DIR", str(blocker))
+    upstream(research("completed", report="Quantum"))
+    provider = OpenAIProvider()
+
+    assert provider.check_status("resp_1") == "completed"
+    markdown, report_file = provider.get_results("resp_1")
+    assert "Quantum" in markdown
+    assert report_file is None
+
+
+def test_deepseek_results_cached_after_retrieval(upstream):
+    seen = upstream(completion)
+    provider = DeepSeekProvider()
+    request_id, status = provider.create_request("q")
+    assert status == "completed"
+
+    markdown, _ = provider.get_results(request_id)
+    assert "Answer" in markdown
+    assert provider.get_results(request_id)[0] == markdown
+    assert DeepSeekProvider().check_status(request_id) == "completed"
+    assert len(seen) == 1
+
+
+def test_deepseek_evicted_request_is_not_cached(upstream, monkeypatch):
+    monkeypatch.setenv("DEEPSEEK_RESULTS_CACHE_SIZE", "1")
+    upstream(completion)
+    provider = DeepSeekProvider()
+    evicted, _ = provider.create_request("first")
+    provider.create_request("second")
+
+    with pytest.raises(LookupError):
+        provider.get_results(evicted)
+    assert cache.get_entry(provider._request_cache_key(evicted)) == (None, None)
+    assert provider.check_status(evicted) == "in_progress"
+    # Still not cached: a later call must fail again, not return a sentinel
+    with pytest.raises(LookupError):
+        provider.get_results(evicted)
+
+
+def test_sweep_evicts_entries_past_max_age(monkeypatch):
+    monkeypatch.setenv("RESEARCH_CACHE_MAX_AGE", "3600")
+    cache.put("old", "# Old")
+    cache.put("new", "# New")
+    for suffix in (".md", ".json"):
+        age(os.path.join(cache.cache_dir(), f"old{suffix}"), 7200)
+
+    cache.sweep()
+
+    assert cache.get("old") == (None, None)
+    assert cache.get("new")[0] == "# New"
+
+
+def test_sweep_trims_oldest_entries_to_max_size(monkeypatch):
+    # Room for about two of the entries below
+    monkeypatch.setenv("RESEARCH_CACHE_MAX_MB", str(2500 / 1024 / 1024))
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, "x" * 1000)
+        for suffix in (".md", ".json"):
+            age(os.path.join(cache.cache_dir(), f"{key}{suffix}"), 100 - i)
+
+    cache.sweep()
+
+    assert cache.get("a") == (None, None)
+    assert cache.get("b")[0] is not None
+    assert cache.get("c")[0] is not None
+
+
+def test_put_sweeps_at_most_once_per_interval(monkeypatch):
+    sweeps = []
+    monkeypatch.setattr(cache, "sweep", lambda directory=None: sweeps.append(directory))
+
+    for i in range(3):
+        cache.put(f"k{i}", "# Report")
+    assert len(sweeps) == 1
+
+    age(os.path.join(cache.cache_dir(), ".swept"), cache.SWEEP_INTERVAL + 1)
+    cache.put("k3", "# Report")
+    assert len(sweeps) == 2
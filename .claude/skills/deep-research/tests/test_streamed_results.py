@@ -0,0 +1,61 @@
+"""Streaming the first content item of OpenAI results."""
+
+import httpx
+import pytest
+
+from deep_research.providers import openai
+from deep_research.providers.openai import OpenAIProvider
+
+pytestmark = pytest.mark.skipif(openai.ijson is None, reason="needs ijson")
+
+
+def results(body):
+    return lambda request: httpx.Response(200, json={"id": "resp_1", **body})
+
+
+def test_report_item_is_streamed_in_one_request(upstream):
+    body = {"content": [{"research": "Streamed report", "citations": []}]}
+    seen = upstream(results(body))
+
+    markdown, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Streamed report" in markdown
+    assert len(seen) == 1
+
+
+def test_text_item_is_used_as_is(upstream):
+    seen = upstream(results({"content": [{"text": "Plain text"}]}))
+
+    markdown, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Plain text" in markdown
+    assert len(seen) == 1
+
+
+def test_item_without_report_falls_back_to_full_response(upstream):
+    body = {"content": [{"type": "reasoning"}], "report": "Top-level report"}
+    seen = upstream(results(body))
+
+    markdown, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Top-level report" in markdown
+    assert len(seen) == 2
+
+
+def test_missing_content_falls_back_to_full_response(upstream):
+    seen = upstream(results({"report": "Top-level report"}))
+
+    markdown, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Top-level report" in markdown
+    assert len(seen) == 2
+
+
+def test_buffered_without_ijson(upstream, monkeypatch):
+    monkeypatch.setattr(openai, "ijson", None)
+    seen = upstream(results({"report": "Top-level report"}))
+
+    markdown, _ = OpenAIProvider().get_results("resp_1")
+
+    assert "Top-level report" in markdown
+    assert len(seen) == 1